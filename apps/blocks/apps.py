@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class BlocksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.blocks"
+
+    def ready(self):
+        super().ready()
+
+        # Import signal handlers
+        from . import signals  # noqa: F401
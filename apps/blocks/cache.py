@@ -0,0 +1,85 @@
+"""
+Render cache for StreamField blocks.
+
+Blocks whose HTML depends on nothing but their value opt in with the
+``cache_render`` Meta option. Their HTML is kept in a process-local cache
+under a key made of the block class, a hash of the block's raw JSON and the
+modification time of its template, so editing a block, or deploying a new
+template, simply yields a new key. Blocks choosing snippets add a version
+token per chosen snippet, bumped when the snippet is saved or deleted. Rich
+text may link to pages, so page and site changes drop the whole cache.
+"""
+
+import hashlib
+import json
+import uuid
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from wagtail import blocks
+from wagtail.snippets.blocks import SnippetChooserBlock
+
+from apps.core.cache import LocalCache
+from apps.core.utils import get_template_mtime
+
+block_render_cache = LocalCache("block_renders", max_size=2048, timeout=60 * 60)
+
+
+def snippet_version_key(model, pk):
+    return f"block_snippet_version_{model._meta.label_lower}_{pk}"
+
+
+def get_snippet_versions(snippets):
+    """
+    Return the version tokens of ``snippets``, a list of ``(model, pk)``
+    pairs, creating the missing ones.
+    """
+    keys = [snippet_version_key(model, pk) for model, pk in snippets]
+    if not keys:
+        return []
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = uuid.uuid4().hex
+            # Another worker may have created a token in the meantime
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+            versions[key] = version
+    return [versions[key] for key in keys]
+
+
+def bump_snippet_version(model, pk):
+    cache.set(snippet_version_key(model, pk), uuid.uuid4().hex, None)
+
+
+def collect_snippets(block, value, snippets):
+    """Add ``(model, pk)`` for every snippet chosen in ``value`` to ``snippets``."""
+    if value is None:
+        return
+    if isinstance(block, SnippetChooserBlock):
+        snippets.add((block.model_class, value.pk))
+    elif isinstance(block, blocks.StreamBlock):
+        for child in value:
+            collect_snippets(child.block, child.value, snippets)
+    elif isinstance(block, blocks.StructBlock):
+        for name, child_block in block.child_blocks.items():
+            collect_snippets(child_block, value.get(name), snippets)
+    elif isinstance(block, blocks.ListBlock):
+        for child in value:
+            collect_snippets(block.child_block, child, snippets)
+
+
+def get_block_render_key(block, value):
+    """Return the ``block_render_cache`` key of ``value`` rendered by ``block``."""
+    raw = json.dumps(block.get_prep_value(value), sort_keys=True, cls=DjangoJSONEncoder)
+    snippets = set()
+    collect_snippets(block, value, snippets)
+    snippets = sorted(
+        snippets, key=lambda snippet: (snippet[0]._meta.label, snippet[1])
+    )
+    return (
+        f"{type(block).__module__}.{type(block).__qualname__}",
+        hashlib.sha256(raw.encode()).hexdigest(),
+        get_template_mtime(block.meta.template),
+        tuple(get_snippet_versions(snippets)),
+    )
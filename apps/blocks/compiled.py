@@ -0,0 +1,180 @@
+"""
+Compiled StreamField bodies.
+
+The body of a page only changes when a revision is published, yet every
+uncached request converts its JSON to Python values, nested column and
+slider streams included, and renders it. Page types setting
+``compile_body`` have the HTML of their top-level blocks stored when they
+are published, along with the objects it was rendered from (snippets, pages
+linked from rich text...). Requests then serve the stored HTML, only
+converting and rendering the blocks that show images, whose storage URLs may
+be signed and expire.
+
+Changing one of the objects a body depends on recompiles it with
+``compile_bodies_task``. There is no task worker, so the task runs in the
+request that changed the object, and only recompiles a bounded number of
+bodies; the others are dropped. Bodies also store a fingerprint of the block
+templates they were rendered with. Dropped bodies, and bodies rendered with
+templates changed since, are compiled when they are next requested.
+"""
+
+import hashlib
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from django.db.models import CharField
+from django.db.models.functions import Cast
+from django.utils.safestring import mark_safe
+from wagtail import blocks
+from wagtail.blocks import StreamValue
+from wagtail.images.models import AbstractImage
+from wagtail.models import Page
+
+from apps.core.utils import get_template_mtime
+
+from .models import CompiledBody, CompiledBodyDependency
+from .prefetch import prefetch_stream
+from .renditions import collect_renditions
+
+# Bump when the format of the stored fragments changes
+COMPILED_BODY_FORMAT = 1
+
+
+def collect_templates(block, templates):
+    """Add the templates of ``block`` and its descendants to ``templates``."""
+    template = getattr(block.meta, "template", None)
+    if template:
+        templates.add(template)
+    if isinstance(block, (blocks.StreamBlock, blocks.StructBlock)):
+        for child_block in block.child_blocks.values():
+            collect_templates(child_block, templates)
+    elif isinstance(block, blocks.ListBlock):
+        collect_templates(block.child_block, templates)
+
+
+def get_templates_fingerprint(stream_block):
+    """
+    Return a hash of ``COMPILED_BODY_FORMAT`` and of the modification times
+    of the templates of ``stream_block`` and its descendants.
+    """
+    templates = set()
+    collect_templates(stream_block, templates)
+    fingerprint = [COMPILED_BODY_FORMAT]
+    fingerprint += [(name, get_template_mtime(name)) for name in sorted(templates)]
+    return hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+
+
+def get_base_content_type(model):
+    """Return the content type of the topmost concrete model of ``model``."""
+    model = model._meta.concrete_model
+    parents = model._meta.get_parent_list()
+    return ContentType.objects.get_for_model(parents[-1] if parents else model)
+
+
+def shows_images(block, value, references):
+    plan = {}
+    collect_renditions(block, value, plan)
+    return bool(plan) or any(
+        issubclass(model, AbstractImage) for model, _object_id in references
+    )
+
+
+def compile_body(page):
+    """
+    Render the live body of ``page`` and store it with its dependencies,
+    replacing its previous compiled body. Returns the fragments.
+    """
+    body = prefetch_stream(page.body)
+    fingerprint = get_templates_fingerprint(body.stream_block)
+    fragments = []
+    references = set()
+    for child in body:
+        child_references = {
+            (model, str(object_id))
+            for model, object_id, _model_path, _content_path in (
+                child.block.extract_references(child.value)
+            )
+        }
+        if shows_images(child.block, child.value, child_references):
+            fragments.append(None)
+        else:
+            fragments.append(str(child.render()))
+            references |= child_references
+
+    try:
+        with transaction.atomic():
+            CompiledBody.objects.filter(page=page).delete()
+            compiled = CompiledBody.objects.create(
+                page=page,
+                revision_id=page.live_revision_id,
+                fingerprint=fingerprint,
+                fragments=fragments,
+            )
+            CompiledBodyDependency.objects.bulk_create(
+                CompiledBodyDependency(
+                    compiled_body=compiled,
+                    base_content_type=get_base_content_type(model),
+                    object_id=object_id,
+                )
+                for model, object_id in references
+            )
+    except IntegrityError:
+        # Compiled concurrently by another request, whose body is as good
+        pass
+    return fragments
+
+
+def get_body_blocks(page, request):
+    """
+    Return the blocks to render for the body of ``page``: the compiled HTML
+    of its live revision with the blocks showing images converted, compiling
+    it first if it is missing or was rendered with other templates. Previews
+    and pages without a live revision have their whole body converted.
+    """
+    if (
+        not getattr(page, "compile_body", False)
+        or page.live_revision_id is None
+        or getattr(request, "is_preview", False)
+    ):
+        return prefetch_stream(page.body)
+
+    fragments = (
+        CompiledBody.objects.filter(
+            page_id=page.pk,
+            revision_id=page.live_revision_id,
+            fingerprint=get_templates_fingerprint(page.body.stream_block),
+        )
+        .values_list("fragments", flat=True)
+        .first()
+    )
+    if fragments is None or len(fragments) != len(page.body):
+        fragments = compile_body(page)
+
+    body = page.body
+    raw_data = [body.raw_data[i] for i, html in enumerate(fragments) if html is None]
+    dynamic = iter(
+        prefetch_stream(StreamValue(body.stream_block, raw_data, is_lazy=True))
+    )
+    return [next(dynamic) if html is None else mark_safe(html) for html in fragments]
+
+
+def get_dependent_page_ids(model, object_ids):
+    """
+    Return the ids of the pages whose compiled body depends on objects of
+    ``model`` with ``object_ids``, a list or a queryset of string ids.
+    """
+    return set(
+        CompiledBodyDependency.objects.filter(
+            base_content_type=get_base_content_type(model),
+            object_id__in=object_ids,
+        ).values_list("compiled_body__page_id", flat=True)
+    )
+
+
+def get_subtree_page_ids(page):
+    """Return a queryset of the string ids of ``page`` and its descendants."""
+    return (
+        Page.objects.filter(path__startswith=page.path)
+        .annotate(object_id=Cast("pk", CharField()))
+        .values("object_id")
+    )
@@ -0,0 +1,50 @@
+"""
+A StreamField that parses its JSON on first access.
+
+Wagtail decodes the JSON of a StreamField as soon as a row is loaded, so
+listings, search results and route lookups that only read a page's title or
+URL still pay for parsing the whole body. ``LazyStreamField`` loads values as
+a ``LazyStreamValue`` holding the JSON text, which is only parsed when the
+stream is first read. Querysets that never need the body should defer it
+altogether with ``defer_streamfields()``.
+"""
+
+from django.db.models.expressions import Col
+from wagtail.blocks import StreamValue
+from wagtail.fields import StreamField
+
+
+class LazyStreamValue(StreamValue):
+    def __init__(self, stream_block, text):
+        self.stream_block = stream_block
+        self.is_lazy = True
+        self.raw_text = None
+        self._text = text
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set, i.e. before parsing
+        if name in ("_raw_data", "_bound_blocks"):
+            value = self.stream_block.to_python(self._text)
+            self._raw_data = value._raw_data
+            self._bound_blocks = value._bound_blocks
+            self.raw_text = value.raw_text
+            return getattr(self, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+
+class LazyStreamField(StreamField):
+    def from_db_value(self, value, expression, connection):
+        # Values of key transforms and other expressions are decoded as usual
+        if not isinstance(value, str) or not isinstance(expression, Col):
+            return super().from_db_value(value, expression, connection)
+        result = LazyStreamValue(self.stream_block, value)
+        # Used to pickle the value, as in StreamField.to_python
+        result._stream_field = self
+        return result
+
+    def deconstruct(self):
+        # Stored exactly like a StreamField, so migrations don't need to know
+        name, _path, args, kwargs = super().deconstruct()
+        return name, "wagtail.fields.StreamField", args, kwargs
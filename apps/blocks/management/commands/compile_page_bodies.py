@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from wagtail.models import Page, get_page_models
+
+from apps.blocks.compiled import compile_body
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile the bodies of all live pages whose type sets compile_body. "
+        "Bodies are compiled when pages are published, and when they are "
+        "first requested after changes to block templates; run this to "
+        "compile them ahead of the first requests."
+    )
+
+    def handle(self, *args, **options):
+        models = [
+            model
+            for model in get_page_models()
+            if getattr(model, "compile_body", False)
+        ]
+        pages = (
+            Page.objects.type(*models)
+            .live()
+            .filter(live_revision__isnull=False)
+            .specific()
+        )
+        count = 0
+        for page in pages.iterator():
+            compile_body(page)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Compiled {count} page bodies"))
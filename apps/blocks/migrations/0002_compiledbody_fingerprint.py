@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blocks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="compiledbody",
+            name="fingerprint",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -1,8 +1,8 @@
+from django.db import models
 from wagtail import blocks
-from wagtail.images.blocks import ImageChooserBlock
 from wagtail.embeds.blocks import EmbedBlock
-from wagtail.snippets.blocks import SnippetChooserBlock
 from apps.snippets.models import Cta, Faq, TeamMember, Testimonial
+from .prefetch import PrefetchedImageChooserBlock, PrefetchedSnippetChooserBlock
 
 
 class HeadingBlock(blocks.StructBlock):
@@ -23,6 +23,8 @@ class HeadingBlock(blocks.StructBlock):
     )
 
     class Meta:
+        # Rendered HTML depends only on the value, see apps.blocks.cache
+        cache_render = True
         icon = "title"
         template = "blocks/heading_block.html"
 
@@ -33,6 +35,7 @@ class RichTextBlock(blocks.RichTextBlock):
     """
 
     class Meta:
+        cache_render = True
         icon = "doc-full"
         template = "blocks/rich_text_block.html"
 
@@ -42,11 +45,13 @@ class ImageBlock(blocks.StructBlock):
     Custom image block with alt text and caption.
     """
 
-    image = ImageChooserBlock(required=True)
+    image = PrefetchedImageChooserBlock(required=True)
     caption = blocks.CharBlock(required=False)
     attribution = blocks.CharBlock(required=False)
 
     class Meta:
+        # Renditions rendered by the template, see apps.blocks.renditions
+        renditions = {"image": ["width-800"]}
         icon = "image"
         template = "blocks/image_block.html"
 
@@ -61,6 +66,7 @@ class QuoteBlock(blocks.StructBlock):
     author_title = blocks.CharBlock(required=False)
 
     class Meta:
+        cache_render = True
         icon = "openquote"
         template = "blocks/quote_block.html"
 
@@ -71,6 +77,7 @@ class EmbedBlock(EmbedBlock):
     """
 
     class Meta:
+        cache_render = True
         icon = "media"
         template = "blocks/embed_block.html"
 
@@ -92,6 +99,7 @@ class ButtonBlock(blocks.StructBlock):
     )
 
     class Meta:
+        cache_render = True
         icon = "link"
         template = "blocks/button_block.html"
 
@@ -103,11 +111,12 @@ class CardBlock(blocks.StructBlock):
 
     title = blocks.CharBlock(required=True, max_length=100)
     text = blocks.RichTextBlock(required=True)
-    image = ImageChooserBlock(required=False)
+    image = PrefetchedImageChooserBlock(required=False)
     link = blocks.URLBlock(required=False)
     link_text = blocks.CharBlock(required=False, max_length=50)
 
     class Meta:
+        renditions = {"image": ["width-400"]}
         icon = "form"
         template = "blocks/card_block.html"
 
@@ -131,6 +140,7 @@ class CallToActionBlock(blocks.StructBlock):
     )
 
     class Meta:
+        cache_render = True
         icon = "arrow-right"
         template = "blocks/cta_block.html"
 
@@ -138,9 +148,10 @@ class CallToActionBlock(blocks.StructBlock):
 class TestimonialBlock(blocks.StructBlock):
     """A block for displaying a Testimonial snippet."""
 
-    testimonial = SnippetChooserBlock(Testimonial)
+    testimonial = PrefetchedSnippetChooserBlock(Testimonial, select_related=["image"])
 
     class Meta:
+        renditions = {"testimonial.image": ["fill-50x50"]}
         icon = "openquote"
         template = "blocks/testimonial_block.html"
         label = "Testimonial"
@@ -149,9 +160,10 @@ class TestimonialBlock(blocks.StructBlock):
 class TeamMemberBlock(blocks.StructBlock):
     """A block for displaying a Team Member snippet."""
 
-    team_member = SnippetChooserBlock(TeamMember)
+    team_member = PrefetchedSnippetChooserBlock(TeamMember, select_related=["photo"])
 
     class Meta:
+        renditions = {"team_member.photo": ["fill-150x150"]}
         icon = "user"
         template = "blocks/team_member_block.html"
         label = "Team Member"
@@ -160,9 +172,10 @@ class TeamMemberBlock(blocks.StructBlock):
 class FaqBlock(blocks.StructBlock):
     """A block for displaying a FAQ snippet."""
 
-    faq = SnippetChooserBlock(Faq)
+    faq = PrefetchedSnippetChooserBlock(Faq)
 
     class Meta:
+        cache_render = True
         icon = "help"
         template = "blocks/faq_block.html"
         label = "FAQ"
@@ -171,9 +184,10 @@ class FaqBlock(blocks.StructBlock):
 class CtaSnippetBlock(blocks.StructBlock):
     """A block for displaying a CTA snippet."""
 
-    cta = SnippetChooserBlock(Cta)
+    cta = PrefetchedSnippetChooserBlock(Cta)
 
     class Meta:
+        cache_render = True
         icon = "bullhorn"
         template = "blocks/cta_snippet_block.html"
         label = "CTA Snippet"
@@ -235,7 +249,7 @@ class SimpleHeroBlock(blocks.StructBlock):
 
     title = blocks.CharBlock(required=True, max_length=100)
     subtitle = blocks.CharBlock(required=False, max_length=200)
-    background_image = ImageChooserBlock(required=False)
+    background_image = PrefetchedImageChooserBlock(required=False)
     text_color = blocks.ChoiceBlock(
         choices=[
             ("text-white", "White"),
@@ -256,6 +270,7 @@ class SimpleHeroBlock(blocks.StructBlock):
     )
 
     class Meta:
+        renditions = {"background_image": ["width-1200"]}
         icon = "image"
         template = "blocks/simple_hero_block.html"
         label = "Simple Hero"
@@ -299,6 +314,7 @@ class TableBlock(blocks.StructBlock):
     )
 
     class Meta:
+        cache_render = True
         icon = "table"
         template = "blocks/table_block.html"
         label = "Table"
@@ -311,7 +327,7 @@ class SideBySideHeroBlock(blocks.StructBlock):
 
     title = blocks.CharBlock(required=True, max_length=100)
     subtitle = blocks.CharBlock(required=False, max_length=200)
-    image = ImageChooserBlock(required=True)
+    image = PrefetchedImageChooserBlock(required=True)
     image_side = blocks.ChoiceBlock(
         choices=[
             ("left", "Left"),
@@ -331,6 +347,7 @@ class SideBySideHeroBlock(blocks.StructBlock):
     )
 
     class Meta:
+        renditions = {"image": ["width-500"]}
         icon = "image"
         template = "blocks/side_by_side_hero_block.html"
         label = "Side-by-Side Hero"
@@ -364,6 +381,7 @@ class VideoHeroBlock(blocks.StructBlock):
     )
 
     class Meta:
+        cache_render = True
         icon = "media"
         template = "blocks/video_hero_block.html"
         label = "Video Hero"
@@ -394,3 +412,62 @@ class ContentStreamBlock(BaseStreamBlock):
     slider = SliderBlock()
     marquee = MarqueeBlock()
     table = TableBlock()
+
+
+class CompiledBody(models.Model):
+    """
+    The rendered HTML of the top-level blocks of the body of a live page, as
+    of ``revision``. Blocks rendering images are stored as None and rendered
+    on each request, as storage URLs may be signed and expire. See
+    ``apps.blocks.compiled``.
+    """
+
+    page = models.OneToOneField(
+        "wagtailcore.Page", on_delete=models.CASCADE, related_name="compiled_body"
+    )
+    revision = models.ForeignKey(
+        "wagtailcore.Revision",
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    # Hash of the format and of the block templates the body was rendered
+    # with, see apps.blocks.compiled.get_templates_fingerprint
+    fingerprint = models.CharField(max_length=64, blank=True)
+    fragments = models.JSONField(default=list)
+    compiled_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Compiled body of page {self.page_id}"
+
+
+class CompiledBodyDependency(models.Model):
+    """
+    An object rendered into a compiled body, like a snippet or a page linked
+    from rich text. Changing it recompiles the body.
+    """
+
+    compiled_body = models.ForeignKey(
+        CompiledBody, on_delete=models.CASCADE, related_name="dependencies"
+    )
+    # The content type of the topmost concrete model, so that a page is
+    # found whatever its specific type
+    base_content_type = models.ForeignKey(
+        "contenttypes.ContentType", on_delete=models.CASCADE, related_name="+"
+    )
+    object_id = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["compiled_body", "base_content_type", "object_id"],
+                name="unique_compiled_body_dependency",
+            )
+        ]
+        indexes = [
+            # Objects changing look up the bodies to recompile by this index
+            models.Index(
+                fields=["base_content_type", "object_id"],
+                name="blocks_dependency_object_idx",
+            )
+        ]
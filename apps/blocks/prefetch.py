@@ -0,0 +1,124 @@
+"""
+Bulk resolution of the snippets and images chosen in a StreamField.
+
+Wagtail converts the chooser blocks of a stream one level and one block type
+at a time, so the same model is queried again for every nesting level and
+block type it appears in (a testimonial at the top level, in a column, in a
+slider...), and relations of the chosen objects, like a testimonial's image,
+are loaded one by one when rendering. ``prefetch_stream`` walks the raw data
+of the whole tree first, fetches every model in a single query with those
+relations joined, and seeds the chooser blocks below with the results while
+it converts the stream.
+"""
+
+import copy
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from wagtail import blocks
+from wagtail.images.blocks import ImageChooserBlock
+from wagtail.snippets.blocks import SnippetChooserBlock
+
+from .renditions import prefetch_renditions
+
+# Model -> (ids requested, {id: object}) of the stream being converted
+prefetched_objects = ContextVar("prefetched_objects", default=None)
+
+
+def to_pk(model, value):
+    return None if value is None else model._meta.pk.to_python(value)
+
+
+class PrefetchedChooserMixin:
+    """
+    Chooser block that takes its objects from ``prefetch_stream`` when they
+    have been fetched, and queries them as usual otherwise. ``select_related``
+    names the relations fetched along with the chosen objects.
+    """
+
+    def __init__(self, *args, select_related=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.select_related = list(select_related)
+
+    def bulk_to_python(self, values):
+        prefetched = prefetched_objects.get()
+        if prefetched is None or self.model_class not in prefetched:
+            return super().bulk_to_python(values)
+        requested, objects = prefetched[self.model_class]
+        ids = [to_pk(self.model_class, value) for value in values]
+        if not requested.issuperset(id for id in ids if id is not None):
+            return super().bulk_to_python(values)
+
+        # Every occurrence gets its own instance, as in Wagtail
+        return [copy.copy(objects[id]) if id in objects else None for id in ids]
+
+
+class PrefetchedSnippetChooserBlock(PrefetchedChooserMixin, SnippetChooserBlock):
+    pass
+
+
+class PrefetchedImageChooserBlock(PrefetchedChooserMixin, ImageChooserBlock):
+    pass
+
+
+def collect_chosen_ids(block, value, ids, related):
+    """
+    Add the ids chosen in the raw ``value`` of ``block`` and its descendants
+    to ``ids``, and the relations to fetch with them to ``related``, both
+    keyed by model.
+    """
+    if isinstance(block, PrefetchedChooserMixin):
+        if value is not None:
+            ids[block.model_class].add(to_pk(block.model_class, value))
+            related[block.model_class].update(block.select_related)
+    elif isinstance(block, blocks.StreamBlock):
+        for child in value or []:
+            child_block = block.child_blocks.get(child.get("type"))
+            if child_block is not None:
+                collect_chosen_ids(child_block, child.get("value"), ids, related)
+    elif isinstance(block, blocks.StructBlock):
+        for name, child_block in block.child_blocks.items():
+            if isinstance(value, dict) and name in value:
+                collect_chosen_ids(child_block, value[name], ids, related)
+    elif isinstance(block, blocks.ListBlock):
+        for child in value or []:
+            if isinstance(child, dict) and child.get("type") == "item":
+                child = child.get("value")
+            collect_chosen_ids(block.child_block, child, ids, related)
+
+
+@contextmanager
+def seed_prefetched_objects(objects):
+    token = prefetched_objects.set(objects)
+    try:
+        yield
+    finally:
+        prefetched_objects.reset(token)
+
+
+def prefetch_stream(stream_value):
+    """
+    Convert a lazily loaded StreamField value with one query per model chosen
+    anywhere in it, then prefetch the renditions its templates render.
+    Values that are already converted only have their renditions prefetched.
+    """
+    if getattr(stream_value, "is_lazy", False):
+        ids = defaultdict(set)
+        related = defaultdict(set)
+        collect_chosen_ids(
+            stream_value.stream_block, stream_value.raw_data, ids, related
+        )
+
+        objects = {}
+        for model, model_ids in ids.items():
+            queryset = model._default_manager.select_related(*sorted(related[model]))
+            objects[model] = (model_ids, queryset.in_bulk(model_ids))
+
+        with seed_prefetched_objects(objects):
+            # Converting the top level converts nested streams along with it
+            for _block in stream_value:
+                pass
+
+    prefetch_renditions(stream_value)
+    return stream_value
@@ -0,0 +1,130 @@
+"""
+Rendition planning for StreamField values.
+
+Every ``{% image %}`` tag in a block template looks its rendition up on its
+own, and generates and uploads a missing one synchronously, so a cold page
+makes a series of storage round trips. Blocks declare the renditions their
+templates use in a ``renditions`` Meta option, mapping the name of an image
+child block (or a dotted path to the image of a chosen snippet) to filter
+specs. ``prefetch_renditions`` collects them from a whole stream, loads the
+existing renditions in one query and generates the missing ones in a thread
+pool, leaving them on the images for the template tags to pick up.
+"""
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.db import connections
+from django.db.models import Prefetch, prefetch_related_objects
+from wagtail import blocks
+from wagtail.images import get_image_model
+from wagtail.images.models import Filter
+
+# Images whose missing renditions are generated and uploaded at once
+RENDITION_WORKERS = 4
+
+
+def resolve_path(value, path):
+    """Follow a dotted ``path`` from a StructValue, returning None on gaps."""
+    name, *attributes = path.split(".")
+    obj = value.get(name)
+    for attribute in attributes:
+        obj = getattr(obj, attribute, None)
+    return obj
+
+
+def collect_renditions(block, value, plan):
+    """
+    Add the images used in ``value`` of ``block`` and its descendants to
+    ``plan``, which maps image ids to the instances found for them and the
+    filter specs the templates render them with.
+    """
+    if value is None:
+        return
+    if isinstance(block, blocks.StreamBlock):
+        for child in value:
+            collect_renditions(child.block, child.value, plan)
+    elif isinstance(block, blocks.StructBlock):
+        for path, specs in getattr(block.meta, "renditions", {}).items():
+            image = resolve_path(value, path)
+            if image is not None:
+                instances, image_specs = plan.setdefault(image.pk, ([], set()))
+                instances.append(image)
+                image_specs.update(specs)
+        for name, child_block in block.child_blocks.items():
+            collect_renditions(child_block, value.get(name), plan)
+    elif isinstance(block, blocks.ListBlock):
+        for child in value:
+            collect_renditions(block.child_block, child, plan)
+
+
+def generate_renditions(image, filters):
+    """
+    Generate and upload the renditions of ``image`` for ``filters``,
+    returning unsaved rendition instances. Runs in a worker thread, so it
+    only touches the storage, not the database.
+    """
+    try:
+        with image.open_file() as file:
+            source = file.read()
+        renditions = []
+        for filter in filters:
+            rendition = image.generate_rendition_instance(filter, BytesIO(source))
+            rendition.file.save(rendition.file.name, rendition.file.file, save=False)
+            renditions.append(rendition)
+        return renditions
+    finally:
+        connections.close_all()
+
+
+def prefetch_renditions(stream_value):
+    """
+    Make sure every rendition the templates of ``stream_value`` render exists
+    and is attached to its image, with a single query when they all exist.
+    """
+    plan = {}
+    collect_renditions(stream_value.stream_block, stream_value, plan)
+    if not plan:
+        return
+
+    # Snippets chosen several times share their image instance
+    instances = list(
+        {
+            id(image): image for images, _specs in plan.values() for image in images
+        }.values()
+    )
+    specs = set().union(*(specs for _images, specs in plan.values()))
+    Rendition = get_image_model().get_rendition_model()
+    prefetch_related_objects(
+        instances,
+        Prefetch(
+            "renditions",
+            queryset=Rendition.objects.filter(filter_spec__in=specs),
+            to_attr="prefetched_renditions",
+        ),
+    )
+
+    missing = {}
+    for images, image_specs in plan.values():
+        filters = [Filter(spec) for spec in sorted(image_specs)]
+        existing = images[0].find_existing_renditions(*filters)
+        if len(existing) < len(filters):
+            missing[images[0]] = [f for f in filters if f not in existing]
+    if not missing:
+        return
+
+    with ThreadPoolExecutor(max_workers=RENDITION_WORKERS) as executor:
+        generated = list(
+            executor.map(generate_renditions, missing.keys(), missing.values())
+        )
+    renditions = [rendition for batch in generated for rendition in batch]
+    # Renditions created concurrently by another request are kept, the
+    # duplicate uploaded here is still a valid file for this render
+    Rendition.objects.bulk_create(renditions, ignore_conflicts=True)
+
+    by_image = defaultdict(list)
+    for rendition in renditions:
+        by_image[rendition.image_id].append(rendition)
+    for image in instances:
+        image.prefetched_renditions.extend(by_image[image.pk])
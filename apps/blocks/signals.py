@@ -0,0 +1,95 @@
+"""
+Signal handlers that keep cached block renders and compiled bodies in sync
+with the database.
+
+Changes are applied once the surrounding transaction commits, so that a
+request running concurrently with an editor's save can never cache the old
+HTML under the new key, and recompiling sees the new data.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.documents import get_document_model
+from wagtail.models import Page, Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from apps.snippets.models import Cta, Faq, TeamMember, Testimonial
+
+from .cache import block_render_cache, bump_snippet_version
+from .compiled import get_dependent_page_ids, get_subtree_page_ids
+from .models import CompiledBody
+from .tasks import compile_bodies_task
+
+Document = get_document_model()
+
+
+def recompile_on_commit(page_ids):
+    page_ids = sorted(set(page_ids))
+    if page_ids:
+        transaction.on_commit(lambda: compile_bodies_task.enqueue(page_ids))
+
+
+@receiver(post_save, sender=Cta)
+@receiver(post_delete, sender=Cta)
+@receiver(post_save, sender=Faq)
+@receiver(post_delete, sender=Faq)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+@receiver(post_save, sender=Testimonial)
+@receiver(post_delete, sender=Testimonial)
+def invalidate_snippet_renders(sender, instance, **kwargs):
+    pk = instance.pk
+    transaction.on_commit(lambda: bump_snippet_version(sender, pk))
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def invalidate_block_renders(sender, **kwargs):
+    # Rich text renders the URLs of the pages it links to
+    transaction.on_commit(block_render_cache.invalidate)
+
+
+@receiver(post_save, sender=Cta)
+@receiver(post_delete, sender=Cta)
+@receiver(post_save, sender=Faq)
+@receiver(post_delete, sender=Faq)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+@receiver(post_save, sender=Testimonial)
+@receiver(post_delete, sender=Testimonial)
+@receiver(post_save, sender=Document)
+@receiver(post_delete, sender=Document)
+def recompile_bodies_using_object(sender, instance, **kwargs):
+    recompile_on_commit(get_dependent_page_ids(sender, [str(instance.pk)]))
+
+
+@receiver(page_published)
+def compile_published_body(sender, instance, **kwargs):
+    page_ids = get_dependent_page_ids(Page, get_subtree_page_ids(instance))
+    if getattr(instance, "compile_body", False):
+        page_ids.add(instance.pk)
+    # Publishing a new slug also changes the URLs of the page's descendants
+    recompile_on_commit(page_ids)
+
+
+@receiver(page_unpublished)
+def recompile_bodies_linking_to_unpublished_page(sender, instance, **kwargs):
+    recompile_on_commit(get_dependent_page_ids(Page, [str(instance.pk)]))
+
+
+@receiver(post_page_move)
+def recompile_bodies_linking_to_moved_pages(sender, instance, **kwargs):
+    recompile_on_commit(get_dependent_page_ids(Page, get_subtree_page_ids(instance)))
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def drop_all_bodies(sender, **kwargs):
+    # Page URLs are relative or absolute depending on the sites. Recompiling
+    # every body would take too long inline, so they are compiled when next
+    # requested
+    transaction.on_commit(CompiledBody.objects.all().delete)
@@ -0,0 +1,25 @@
+from django_tasks import task
+from wagtail.models import Page
+
+from .compiled import compile_body
+from .models import CompiledBody
+
+# Bodies recompiled by one task. Tasks run in the request that enqueued them
+# (see TASKS), so the bodies of further pages are dropped instead, and
+# compiled when they are next requested
+COMPILE_BATCH_SIZE = 50
+
+
+@task()
+def compile_bodies_task(page_ids):
+    """
+    Recompile the bodies of the live pages with ``page_ids`` whose type sets
+    ``compile_body``, up to ``COMPILE_BATCH_SIZE`` of them, and drop the
+    bodies of the others.
+    """
+    page_ids = sorted(page_ids)
+    CompiledBody.objects.filter(page_id__in=page_ids[COMPILE_BATCH_SIZE:]).delete()
+    pages = Page.objects.filter(pk__in=page_ids[:COMPILE_BATCH_SIZE], live=True)
+    for page in pages.specific():
+        if getattr(page, "compile_body", False) and page.live_revision_id:
+            compile_body(page)
@@ -0,0 +1,32 @@
+from django import template
+from django.utils.encoding import force_str
+from django.utils.html import conditional_escape
+
+from apps.blocks.cache import block_render_cache, get_block_render_key
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def include_cached_block(context, value):
+    """
+    Render a StreamField item like ``{% include_block %}``, taking the HTML
+    of blocks with the ``cache_render`` Meta option from
+    ``block_render_cache``.
+    """
+    if not hasattr(value, "render_as_block"):
+        output = value
+    else:
+        block = getattr(value, "block", None)
+        new_context = context.flatten()
+        if block is not None and getattr(block.meta, "cache_render", False):
+            output = block_render_cache.get_or_set(
+                get_block_render_key(block, value.value),
+                lambda: value.render_as_block(context=new_context),
+            )
+        else:
+            output = value.render_as_block(context=new_context)
+
+    if context.autoescape:
+        return conditional_escape(output)
+    return force_str(output)
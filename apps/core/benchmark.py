@@ -0,0 +1,26 @@
+"""
+Helpers shared by the benchmark commands of the apps.
+"""
+
+import math
+import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark fixtures once measurements are done."""
+
+
+def measure(func, repeat):
+    """Return ``(query count, best time in ms)`` for calling ``func``."""
+    best = math.inf
+    queries = 0
+    for _run in range(repeat):
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        queries = len(context.captured_queries)
+    return queries, best * 1000
@@ -0,0 +1,146 @@
+"""
+A process-local cache tier for small, hot values that are read on every
+request (navigation, site settings).
+
+Each ``LocalCache`` keeps a bounded LRU of entries in the worker's memory.
+Coherence between workers comes from a generation token stored in the shared
+``default`` cache: invalidating a local cache replaces the token, and every
+worker drops its local entries once it notices the new token. Workers compare
+tokens at most once per ``check_interval`` seconds, so a hit normally never
+leaves the process, at the cost of other workers serving the previous value for
+up to ``check_interval`` seconds after a change.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+
+class LocalCache:
+    def __init__(self, name, max_size=128, timeout=300, check_interval=5):
+        self.name = name
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = None
+        self._generation_checked_at = None
+
+    @property
+    def generation_key(self):
+        return f"local_cache_generation_{self.name}"
+
+    def _get_generation(self):
+        """
+        Return the current generation, syncing it with the shared cache when
+        the last check is older than ``check_interval``.
+        """
+        now = time.monotonic()
+        checked_at = self._generation_checked_at
+        if checked_at is not None and now - checked_at < self.check_interval:
+            return self._generation
+
+        generation = cache.get(self.generation_key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            if not cache.add(self.generation_key, generation, None):
+                generation = cache.get(self.generation_key, generation)
+
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+            self._generation_checked_at = now
+        return generation
+
+    def get(self, key, default=None):
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys):
+        """
+        Return a dict of the values found for ``keys``.
+        """
+        self._get_generation()
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                try:
+                    value, expires_at = self._entries[key]
+                except KeyError:
+                    continue
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+        return found
+
+    def set(self, key, value):
+        """
+        Store ``value`` for ``key``, evicting the least recently used entries
+        beyond ``max_size``.
+        """
+        self._get_generation()
+        expires_at = time.monotonic() + self.timeout
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Drop the entry for ``key`` in this process. Entries that are wrong
+        everywhere should be dropped with ``invalidate`` instead.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_or_set(self, key, default):
+        """
+        Return the value for ``key``, calling ``default()`` to compute and
+        store it on a miss. A value computed while the cache was invalidated
+        is returned but not stored.
+        """
+        return self.get_or_set_many([key], lambda keys: {key: default()})[key]
+
+    def get_or_set_many(self, keys, default):
+        """
+        Return a dict of the values for ``keys``. Missing keys are passed in a
+        single call to ``default(missing_keys)``, which must return a dict of
+        values for them. Values computed while the cache was invalidated are
+        returned but not stored.
+        """
+        generation = self._get_generation()
+        found = self.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if not missing:
+            return found
+
+        computed = default(missing)
+        expires_at = time.monotonic() + self.timeout
+        with self._lock:
+            if generation == self._generation:
+                for key, value in computed.items():
+                    self._entries[key] = (value, expires_at)
+                    self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return {**found, **computed}
+
+    def invalidate(self):
+        """
+        Drop all entries of this cache, in this process immediately and in
+        other processes on their next generation check.
+        """
+        generation = uuid.uuid4().hex
+        cache.set(self.generation_key, generation, None)
+        with self._lock:
+            self._entries.clear()
+            self._generation = generation
+            self._generation_checked_at = time.monotonic()
@@ -3,6 +3,7 @@ from django.db import models
 from wagtail.models import Page
 from wagtail.admin.panels import FieldPanel
 from wagtailseo.models import SeoMixin
+from .routing import find_page_by_uuid, parse_uuid
 
 
 class BasePage(SeoMixin, Page):
@@ -55,3 +56,31 @@ class BasePage(SeoMixin, Page):
     content_panels = base_content_panels
     promote_panels = SeoMixin.seo_meta_panels + base_promote_panels
     settings_panels = base_settings_panels
+
+    def route(self, request, path_components):
+        """
+        Route children addressed by uuid, either in place of their slug
+        (``/parent/<uuid>/``) or under a ``uuid`` segment
+        (``/parent/uuid/<uuid>/``), as well as by slug.
+        """
+        child_uuid = None
+        if path_components[:1] == ["uuid"] and len(path_components) > 1:
+            child_uuid = parse_uuid(path_components[1])
+            remaining_components = path_components[2:]
+        elif path_components:
+            child_uuid = parse_uuid(path_components[0])
+            remaining_components = path_components[1:]
+
+        if child_uuid is not None:
+            # When only one type of child is allowed, a uuid missing from the
+            # map is still found with a single query
+            child_models = self.specific_class.allowed_subpage_models()
+            subpage = find_page_by_uuid(
+                child_uuid, child_models[0] if len(child_models) == 1 else None
+            )
+            if subpage is not None and subpage.path[: -self.steplen] == self.path:
+                # Cache the parent page on the subpage, as Wagtail does
+                subpage._cached_parent_obj = self
+                return subpage.route(request, remaining_components)
+
+        return super().route(request, path_components)
@@ -0,0 +1,76 @@
+"""
+Routing of pages by their stable ``uuid``.
+
+Pages can be addressed by uuid instead of slug (see
+``BaseEntityPage.url_type_preference``). Resolving a uuid goes through a
+process-local map of uuid to ``(page id, content type)``, so that the page
+is loaded with a single primary key lookup on its own table, whatever its
+type. Entries are checked against the uuid of the page they load, and
+dropped when it was deleted or its uuid changed.
+"""
+
+import uuid
+from functools import cache
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+from .cache import LocalCache
+
+page_uuid_cache = LocalCache("page_uuids", max_size=4096, timeout=24 * 60 * 60)
+
+
+def parse_uuid(value):
+    """Return ``value`` as a UUID, or None if it isn't one."""
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        return None
+
+
+@cache
+def get_uuid_page_models():
+    """
+    The page models whose table holds the ``uuid`` column, i.e. the first
+    concrete subclasses of ``BasePage``.
+    """
+    from .models import BasePage
+
+    return [
+        model
+        for model in apps.get_models()
+        if issubclass(model, BasePage) and model._meta.get_field("uuid").model is model
+    ]
+
+
+def find_page_by_uuid(value, model=None):
+    """
+    Return the specific page with the uuid ``value``, or None. If the type of
+    the page is known, passing it as ``model`` looks up a page missing from
+    the map in a single query too; otherwise the uuid index of every table
+    holding page uuids is searched.
+    """
+    key = value.hex
+    entry = page_uuid_cache.get(key)
+    if entry is not None:
+        page_id, content_type_id = entry
+        model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model_class is not None:
+            page = model_class.objects.filter(pk=page_id, uuid=value).first()
+            if page is not None:
+                return page
+        page_uuid_cache.delete(key)
+
+    page = None
+    if model is not None:
+        page = model.objects.filter(uuid=value).first()
+    else:
+        for candidate in get_uuid_page_models():
+            page = candidate.objects.filter(uuid=value).first()
+            if page is not None:
+                page = page.specific
+                break
+
+    if page is not None:
+        page_uuid_cache.set(key, (page.pk, page.content_type_id))
+    return page
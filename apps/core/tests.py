@@ -1,3 +1,113 @@
-from django.test import TestCase
+import uuid
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from wagtail.models import Site
+
+from apps.pages.models import ProjectPage, ProjectShowcasePage
+
+from .cache import LocalCache
+from .routing import find_page_by_uuid, page_uuid_cache
+
+# Keeps the tests off the database cache
+TEST_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class LocalCacheTests(TestCase):
+    def test_get_or_set(self):
+        local = LocalCache("test_get_or_set")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual(local.get_or_set("key", compute), "value")
+        self.assertEqual(local.get_or_set("key", compute), "value")
+        self.assertEqual(len(calls), 1)
+
+        local.delete("key")
+        self.assertIsNone(local.get("key"))
+
+    def test_invalidate_reaches_other_processes(self):
+        # Two caches with the same name stand for the tier of two workers
+        local = LocalCache("test_invalidate", check_interval=0)
+        other = LocalCache("test_invalidate", check_interval=0)
+        local.set("key", "value")
+        other.set("key", "value")
+
+        local.invalidate()
+
+        self.assertIsNone(local.get("key"))
+        self.assertIsNone(other.get("key"))
+
+    def test_max_size(self):
+        local = LocalCache("test_max_size", max_size=2)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+
+        self.assertEqual(local.get_many(["a", "b", "c"]), {"a": 1, "c": 3})
+
+
+@override_settings(CACHES=TEST_CACHES)
+class FindPageByUuidTests(TestCase):
+    def setUp(self):
+        page_uuid_cache.invalidate()
+        home = Site.objects.get(is_default_site=True).root_page
+        self.showcase = home.add_child(
+            instance=ProjectShowcasePage(title="Projects", slug="projects")
+        )
+        self.page = self.showcase.add_child(
+            instance=ProjectPage(title="Project", slug="project")
+        )
+        self.other = self.showcase.add_child(
+            instance=ProjectPage(title="Other", slug="other")
+        )
+
+    def test_find(self):
+        page = find_page_by_uuid(self.page.uuid)
+
+        self.assertEqual(page, self.page)
+        self.assertIsInstance(page, ProjectPage)
+        self.assertIsNotNone(page_uuid_cache.get(self.page.uuid.hex))
+        with self.assertNumQueries(1):
+            self.assertEqual(find_page_by_uuid(self.page.uuid), self.page)
+
+    def test_find_showcase(self):
+        self.assertEqual(find_page_by_uuid(self.showcase.uuid), self.showcase)
+
+    def test_unknown_uuid(self):
+        self.assertIsNone(find_page_by_uuid(uuid.uuid4()))
+
+    def test_stale_entry(self):
+        # An entry pointing at another page is not trusted
+        page_uuid_cache.set(
+            self.page.uuid.hex, (self.other.pk, self.other.content_type_id)
+        )
+
+        self.assertEqual(find_page_by_uuid(self.page.uuid), self.page)
+        self.assertEqual(
+            page_uuid_cache.get(self.page.uuid.hex),
+            (self.page.pk, self.page.content_type_id),
+        )
+
+    def test_deleted_page(self):
+        find_page_by_uuid(self.page.uuid)
+        self.page.delete()
+
+        self.assertIsNone(find_page_by_uuid(self.page.uuid))
+        self.assertIsNone(page_uuid_cache.get(self.page.uuid.hex))
+
+    def test_route(self):
+        response = self.client.get(f"/projects/{self.page.uuid}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["page"], self.page)
+
+        response = self.client.get(f"/projects/uuid/{self.page.uuid}/")
+        self.assertEqual(response.status_code, 200)
+
+        # Pages are only found under their parent
+        response = self.client.get(f"/{self.page.uuid}/")
+        self.assertEqual(response.status_code, 404)
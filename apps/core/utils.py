@@ -0,0 +1,57 @@
+import os
+
+from django.template import engines
+from django.urls import NoReverseMatch, reverse
+from wagtail.coreutils import WAGTAIL_APPEND_SLASH
+from wagtail.models import Site
+
+
+def get_page_urls(pages):
+    """
+    Resolve the URLs of many pages at once, the way ``Page.url`` would.
+
+    Site root paths are looked up once (from Wagtail's cached copy) and the
+    serve URL prefix is reversed once, after which every URL is derived from
+    the page's ``url_path`` with plain string operations. Returns a dict of
+    page id to URL, with ``None`` for pages that are not routable.
+    """
+    site_root_paths = Site.get_site_root_paths()
+    num_sites = len({root_path.site_id for root_path in site_root_paths})
+
+    try:
+        serve_prefix = reverse("wagtail_serve", args=("",))
+    except NoReverseMatch:
+        return {page.pk: None for page in pages}
+
+    urls = {}
+    for page in pages:
+        urls[page.pk] = None
+        for root_path in site_root_paths:
+            if page.url_path.startswith(root_path.root_path):
+                page_path = serve_prefix + page.url_path[len(root_path.root_path) :]
+                if not WAGTAIL_APPEND_SLASH and page_path != "/":
+                    page_path = page_path.rstrip("/")
+                # A local URL is sufficient when only a single site is served
+                urls[page.pk] = (
+                    page_path if num_sites == 1 else root_path.root_url + page_path
+                )
+                break
+
+    return urls
+
+
+def get_template_mtime(template_name):
+    """
+    Return the modification time of the file ``template_name`` is loaded
+    from, found without compiling the template, or None.
+    """
+    for backend in engines.all():
+        # Only Django template engines have loaders to ask
+        loaders = getattr(getattr(backend, "engine", None), "template_loaders", [])
+        for loader in loaders:
+            for origin in loader.get_template_sources(template_name):
+                try:
+                    return os.path.getmtime(origin.name)
+                except (OSError, TypeError):
+                    continue
+    return None
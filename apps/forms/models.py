@@ -10,6 +10,8 @@ from wagtail_flexible_forms.models import (
 )
 from apps.core.models import BasePage
 from apps.blocks.models import ContentStreamBlock
+from apps.blocks.compiled import get_body_blocks
+from apps.blocks.fields import LazyStreamField
 from wagtail_flexible_forms.blocks import FormFieldsBlock
 
 
@@ -47,9 +49,13 @@ class FormPage(StreamFormMixin, BasePage):
 
     template = "pages/form_page.html"
     landing_page_template = "pages/form_page_landing.html"
+
     subpage_types = []
 
-    body = StreamField(
+    # Store the rendered body on publish, see apps.blocks.compiled
+    compile_body = True
+
+    body = LazyStreamField(
         ContentStreamBlock(),
         use_json_field=True,
         blank=True,
@@ -92,6 +98,7 @@ class FormPage(StreamFormMixin, BasePage):
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
         context["base_template"] = "base.html"
+        context["body_blocks"] = get_body_blocks(self, request)
         return context
 
     def process_form_submission(self, form):
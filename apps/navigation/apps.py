@@ -1,7 +1,7 @@
+import logging
+
 from django.apps import AppConfig
 from django.db import transaction
-from django.core.cache import cache
-import logging
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,8 @@ class NavigationConfig(AppConfig):
         from django.db.models.signals import post_migrate
         from django.dispatch import receiver
 
+        from . import signals  # noqa: F401
+
         @receiver(post_migrate)
         def create_default_menus_handler(sender, **kwargs):
             if sender.name == self.name:
@@ -43,9 +45,9 @@ class NavigationConfig(AppConfig):
                 Menu.objects.get_or_create(
                     slug="legal-menu", defaults={"title": "Legal Menu"}
                 )
-                
-                # Clear cache for menus since we've created new ones
-                cache.delete_many(["menu_tree_main-menu", "menu_tree_footer-menu", "menu_tree_legal-menu"])
+
+                # Cached menus are invalidated by the post_save signal
+                # handlers once the transaction commits
                 
         except Exception as e:
             # If there's an issue with the database (e.g., not migrated yet),
@@ -0,0 +1,108 @@
+"""
+Versioned cache keys for navigation menus.
+
+Every menu has a version token stored in the cache. Cached menu trees are
+stored under a key that embeds the current token, so invalidating a menu is a
+matter of replacing its token: stale entries are never read again and simply
+expire or get culled by the cache backend.
+"""
+
+import hashlib
+import uuid
+
+from django.core.cache import cache
+
+from apps.core.cache import LocalCache
+from apps.core.utils import get_template_mtime
+
+# Menu data is invalidated through signals, so cached trees never need to expire
+MENU_CACHE_TIMEOUT = None
+
+# Bumped whenever the shape of the cached trees changes, so that a deploy never
+# unpickles entries written by the previous release
+MENU_CACHE_FORMAT = 2
+
+# Templates rendered into cached menu fragments, including the ones they
+# include. Their modification times are part of the fragment keys, so that a
+# deploy changing them never serves HTML rendered with the previous ones
+MENU_FRAGMENT_TEMPLATE_NAMES = [
+    "navigation/desktop_menu.html",
+    "navigation/mobile_menu.html",
+    "navigation/footer_menu.html",
+    "navigation/menu_item.html",
+    "navigation/mobile_menu_item.html",
+    "navigation/lazy_menu_children.html",
+]
+
+# Process-local tier in front of the shared cache, so that the menus rendered
+# on every page are normally served without leaving the worker
+navigation_cache = LocalCache("navigation", max_size=256)
+
+
+def menu_version_key(slug):
+    return f"menu_version_{slug}"
+
+
+def menu_tree_key(slug, version):
+    return f"menu_tree_v{MENU_CACHE_FORMAT}_{slug}_{version}"
+
+
+def _new_version():
+    return uuid.uuid4().hex
+
+
+def get_menu_version(slug):
+    """
+    Return the current version token for a menu, creating one if needed.
+    """
+    return get_menu_versions([slug])[slug]
+
+
+def get_menu_versions(slugs):
+    """
+    Return the current version tokens for several menus, keyed by slug, with
+    a single cache round trip when all of them exist.
+    """
+    keys = {menu_version_key(slug): slug for slug in slugs}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+
+    for slug in slugs:
+        if slug not in versions:
+            key = menu_version_key(slug)
+            version = _new_version()
+            # Another worker may have created a token in the meantime
+            if not cache.add(key, version, MENU_CACHE_TIMEOUT):
+                version = cache.get(key, version)
+            versions[slug] = version
+
+    return versions
+
+
+def invalidate_menus(slugs):
+    """
+    Bump the version of the given menus so their cached data is rebuilt.
+    """
+    slugs = set(slugs)
+    if slugs:
+        cache.set_many(
+            {menu_version_key(slug): _new_version() for slug in slugs},
+            MENU_CACHE_TIMEOUT,
+        )
+        navigation_cache.invalidate()
+
+
+def get_menu_templates_fingerprint():
+    """Return a hash of the modification times of the menu fragment templates."""
+    mtimes = [(name, get_template_mtime(name)) for name in MENU_FRAGMENT_TEMPLATE_NAMES]
+    return hashlib.sha256(repr(mtimes).encode()).hexdigest()[:16]
+
+
+def menu_fragment_key(slug, version, site_id, variant, max_depth=None, bucket=""):
+    """
+    Key for a pre-rendered menu fragment. ``bucket`` distinguishes renders
+    that depend on the current request path.
+    """
+    return (
+        f"menu_fragment_v{MENU_CACHE_FORMAT}_{get_menu_templates_fingerprint()}_"
+        f"{slug}_{version}_{site_id}_{variant}_{max_depth}_{bucket}"
+    )
@@ -0,0 +1,71 @@
+"""
+Shared fixtures and helpers for the navigation benchmark commands.
+"""
+
+import math
+
+from apps.core.benchmark import Rollback, measure
+from apps.navigation.models import Menu, MenuItem
+
+__all__ = [
+    "Rollback",
+    "create_benchmark_menu",
+    "legacy_menu_tree",
+    "measure",
+]
+
+
+def create_benchmark_menu(size, depth, link_page=None):
+    """
+    Create a menu with ``size`` items spread evenly over ``depth`` levels
+    (or ``size`` levels, if there are fewer items), optionally all linking to
+    ``link_page``. Every level gets at least one item.
+    """
+    menu = Menu.objects.create(
+        title=f"Benchmark {size}x{depth}", slug=f"benchmark-{size}-{depth}"
+    )
+    depth = min(depth, size)
+    fanout = max(2, math.ceil(size ** (1 / depth))) if depth else 0
+    parents = [None]
+    created = 0
+
+    for level in range(depth):
+        # Keep one item for each of the levels below
+        count = min(len(parents) * fanout, size - created - (depth - level - 1))
+        items = []
+        for index in range(count):
+            items.append(
+                MenuItem(
+                    menu=menu,
+                    parent=parents[index % len(parents)],
+                    link_title=f"Item {created}",
+                    link_url=f"/item-{created}/",
+                    link_page=link_page,
+                    sort_order=created,
+                )
+            )
+            created += 1
+        parents = MenuItem.objects.bulk_create(items)
+
+    return menu
+
+
+def legacy_menu_tree(menu):
+    """
+    The original recursive builder, which returned model instances (with
+    their linked pages loaded) wrapped in ``{"item", "children"}`` dicts.
+    Kept as a baseline for comparisons.
+    """
+
+    def children(item):
+        return [
+            {"item": child, "children": children(child)}
+            for child in item.children.select_related("link_page").order_by(
+                "sort_order"
+            )
+        ]
+
+    return [
+        {"item": item, "children": children(item)}
+        for item in menu.get_root_menu_items().select_related("link_page")
+    ]
@@ -0,0 +1,65 @@
+import pickle
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from wagtail.models import Page
+
+from ._benchmark import Rollback, create_benchmark_menu, legacy_menu_tree, measure
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the pickled size and unpickling time of cached menu trees "
+        "made of MenuNode tuples against the previous format of pickled "
+        "MenuItem model instances and their linked pages. Fixtures are "
+        "rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[10, 100, 1000],
+            help="Number of menu items per benchmarked menu",
+        )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=3,
+            help="Nesting depth of the benchmarked menus",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of unpickling runs; the best time is reported",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'items':>6} {'models bytes':>13} {'models ms':>10} "
+            f"{'nodes bytes':>12} {'nodes ms':>9}"
+        )
+        # Link items to a real page, as menus built from the page tree do
+        link_page = Page.objects.filter(depth__gt=1).first()
+
+        try:
+            with transaction.atomic():
+                for size in options["sizes"]:
+                    menu = create_benchmark_menu(size, options["depth"], link_page)
+                    models = pickle.dumps(legacy_menu_tree(menu))
+                    nodes = pickle.dumps(menu.get_menu_tree())
+                    models_ms = measure(
+                        lambda models=models: pickle.loads(models), options["repeat"]
+                    )[1]
+                    nodes_ms = measure(
+                        lambda nodes=nodes: pickle.loads(nodes), options["repeat"]
+                    )[1]
+                    self.stdout.write(
+                        f"{size:>6} {len(models):>13} {models_ms:>10.3f} "
+                        f"{len(nodes):>12} {nodes_ms:>9.3f}"
+                    )
+                raise Rollback
+        except Rollback:
+            pass
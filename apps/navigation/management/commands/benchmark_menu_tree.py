@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ._benchmark import Rollback, create_benchmark_menu, legacy_menu_tree, measure
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure query count and build time of Menu.get_menu_tree() for "
+        "synthetic menus of various sizes and depths. All fixtures are "
+        "created inside a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[10, 100, 1000],
+            help="Number of menu items per benchmarked menu",
+        )
+        parser.add_argument(
+            "--depths",
+            nargs="+",
+            type=int,
+            default=[1, 2, 3, 5],
+            help="Nesting depths to benchmark for every size",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of builds per menu; the best time is reported",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'items':>6} {'depth':>6} {'legacy q':>9} {'legacy ms':>10} "
+            f"{'tree q':>7} {'tree ms':>8}"
+        )
+        try:
+            with transaction.atomic():
+                for size in options["sizes"]:
+                    for depth in options["depths"]:
+                        menu = create_benchmark_menu(size, depth)
+                        legacy = measure(
+                            lambda menu=menu: legacy_menu_tree(menu), options["repeat"]
+                        )
+                        tree = measure(menu.get_menu_tree, options["repeat"])
+                        self.stdout.write(
+                            f"{size:>6} {depth:>6} {legacy[0]:>9} {legacy[1]:>10.2f} "
+                            f"{tree[0]:>7} {tree[1]:>8.2f}"
+                        )
+                raise Rollback
+        except Rollback:
+            pass
@@ -1,8 +1,19 @@
+import logging
+from collections import defaultdict
+
 from django.db import models
 from wagtail.models import Orderable
 from wagtail.admin.panels import FieldPanel, InlinePanel
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
+from apps.core.utils import get_page_urls
+from .nodes import EMPTY_MENU_TREE, MenuNode, MenuTree
+
+logger = logging.getLogger(__name__)
+
+# Menu items nested deeper than this are left out of menu trees, so that a
+# runaway parent chain can not blow up building, caching or rendering a menu
+MENU_MAX_DEPTH = 20
 
 
 class MenuItem(Orderable):
@@ -62,6 +73,17 @@ class MenuItem(Orderable):
             return self.link_url
         return "#"
 
+    def get_link(self, page_urls):
+        """
+        Same as ``link``, but looks the page URL up in ``page_urls`` (as
+        returned by ``get_page_urls``) instead of computing it.
+        """
+        if self.link_page_id:
+            return page_urls.get(self.link_page_id)
+        elif self.link_url:
+            return self.link_url
+        return "#"
+
     @property
     def title(self):
         if self.link_title:
@@ -108,21 +130,81 @@ class Menu(ClusterableModel):
         return self.menu_items.filter(parent=None).order_by("sort_order")
 
     def get_menu_tree(self):
-        """Get the complete menu tree with nested structure"""
-        root_items = self.get_root_menu_items()
-        tree = []
-
-        for item in root_items:
-            tree.append({"item": item, "children": self._get_children(item)})
-
-        return tree
-
-    def _get_children(self, parent_item):
-        """Recursively get children for a menu item"""
-        children = parent_item.children.all().order_by("sort_order")
-        result = []
-
-        for child in children:
-            result.append({"item": child, "children": self._get_children(child)})
-
-        return result
+        """
+        Get the complete menu tree: a ``MenuTree`` of nested ``MenuNode``
+        tuples, indexed by link path for active-trail lookups.
+
+        All items of the menu are loaded in a single query (with their linked
+        page joined) and assembled in memory, so the number of queries does not
+        grow with the size or depth of the menu. The URLs of linked pages are
+        resolved in bulk, so rendering the tree does not need any URL routing.
+        """
+        items = self.menu_items.select_related("link_page").order_by("sort_order")
+        return build_menu_trees(items).get(self.pk, EMPTY_MENU_TREE)
+
+    @classmethod
+    def get_menu_trees(cls, slugs):
+        """
+        Get the trees of several menus, keyed by slug, from a single query.
+        Menus that do not exist or have no items get an empty tree.
+        """
+        items = list(
+            MenuItem.objects.filter(menu__slug__in=slugs)
+            .select_related("link_page", "menu")
+            .order_by("sort_order")
+        )
+        trees = build_menu_trees(items)
+        menu_ids = {item.menu.slug: item.menu_id for item in items}
+        return {slug: trees.get(menu_ids.get(slug), EMPTY_MENU_TREE) for slug in slugs}
+
+
+def build_menu_trees(items):
+    """
+    Assemble menu items (of one or more menus) into ``MenuTree`` objects in
+    O(n), keyed by menu id. ``items`` must be ordered by
+    ``sort_order`` and have their linked page loaded.
+
+    Trees are built down from the top-level items, so items caught in a
+    parent cycle (or whose parent belongs to another menu) are never reached,
+    and nesting stops at ``MENU_MAX_DEPTH``. Such items are skipped with a
+    warning instead of breaking the whole menu.
+    """
+    items = list(items)
+    page_urls = get_page_urls([item.link_page for item in items if item.link_page])
+
+    children_by_parent = defaultdict(list)
+    for item in items:
+        children_by_parent[(item.menu_id, item.parent_id)].append(item)
+
+    built = set()
+
+    def build(menu_id, parent_id, depth):
+        if depth > MENU_MAX_DEPTH:
+            return ()
+        children = children_by_parent.get((menu_id, parent_id), [])
+        built.update(item.pk for item in children)
+        return tuple(
+            MenuNode(
+                id=item.pk,
+                title=item.title,
+                href=item.get_link(page_urls),
+                new_tab=item.open_in_new_tab,
+                children=build(menu_id, item.pk, depth + 1),
+            )
+            for item in children
+        )
+
+    menu_ids = {item.menu_id for item in items}
+    trees = {
+        menu_id: MenuTree.from_nodes(build(menu_id, None, 1)) for menu_id in menu_ids
+    }
+
+    skipped = [item.pk for item in items if item.pk not in built]
+    if skipped:
+        logger.warning(
+            f"Skipped menu items {skipped}: they are nested deeper than "
+            f"{MENU_MAX_DEPTH} levels or not reachable from the top level of "
+            f"their menu (parent cycle or parent in another menu)"
+        )
+
+    return trees
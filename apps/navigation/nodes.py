@@ -0,0 +1,138 @@
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+
+class MenuNode(NamedTuple):
+    """
+    Immutable, compact representation of a menu item as rendered by the
+    menu templates. Cached menu trees are nested tuples of these, which pickle
+    to a fraction of the size of model instances and unpickle almost for free.
+    """
+
+    id: int
+    title: str
+    href: str | None
+    new_tab: bool
+    children: tuple["MenuNode", ...]
+    # Set on nodes whose children were cut off by ``MenuTree.limit_depth``,
+    # so the templates can load them on demand
+    lazy: bool = False
+
+
+class ActiveTrail(NamedTuple):
+    """
+    The nodes of a menu to highlight for a request: the node linking to the
+    current page (if any) and the ids of its ancestors. It is computed per
+    request and passed to the templates alongside the shared cached tree,
+    which is never mutated.
+    """
+
+    current: int | None
+    ancestors: frozenset[int]
+
+    @property
+    def key(self):
+        """A short string identifying this trail, for use in cache keys."""
+        if self.current is None and not self.ancestors:
+            return ""
+        return f"{self.current}-{'.'.join(map(str, sorted(self.ancestors)))}"
+
+
+NO_ACTIVE_TRAIL = ActiveTrail(None, frozenset())
+
+
+class MenuTree(NamedTuple):
+    """
+    A built menu: its root nodes plus an index of link paths to the ids of
+    the linking node and its ancestors (root first), precomputed when the
+    tree is built so that the active trail of a request is a dict lookup.
+    """
+
+    nodes: tuple[MenuNode, ...]
+    paths: dict[str, tuple[int, ...]]
+
+    @classmethod
+    def from_nodes(cls, nodes):
+        paths = {}
+
+        def index(nodes, parents):
+            for node in nodes:
+                trail = (*parents, node.id)
+                path = _link_path(node.href)
+                # The shallowest node wins when several link to the same page
+                if path is not None:
+                    paths.setdefault(path, trail)
+                index(node.children, trail)
+
+        index(nodes, ())
+        return cls(nodes, paths)
+
+    def get_active_trail(self, path):
+        """
+        Return the ``ActiveTrail`` for a request path. When no node links to
+        the path itself, the node linking to its closest ancestor path (if
+        any) is highlighted as an ancestor.
+        """
+        trail = self.paths.get(path)
+        if trail is not None:
+            return ActiveTrail(trail[-1], frozenset(trail[:-1]))
+
+        # Links to the site root are not treated as ancestors of every page
+        while (path := path.rstrip("/").rpartition("/")[0] + "/") != "/":
+            trail = self.paths.get(path)
+            if trail is not None:
+                return ActiveTrail(None, frozenset(trail))
+
+        return NO_ACTIVE_TRAIL
+
+    def limit_depth(self, max_depth):
+        """
+        Return a copy of the tree keeping only ``max_depth`` levels of nodes.
+        The path index is kept whole, so the trail to a page below the cut
+        still highlights its visible ancestors.
+        """
+        if max_depth is None:
+            return self
+        return self._replace(nodes=limit_depth(self.nodes, max_depth))
+
+    def get_children(self, node_id):
+        """
+        Return the children of the node with the given id, or None if the
+        tree has no such node.
+        """
+        stack = list(self.nodes)
+        while stack:
+            node = stack.pop()
+            if node.id == node_id:
+                return node.children
+            stack.extend(node.children)
+        return None
+
+
+def limit_depth(nodes, max_depth):
+    """
+    Cut ``nodes`` down to ``max_depth`` levels. Nodes of the last level that
+    had children are marked as ``lazy``.
+    """
+    if max_depth <= 1:
+        return tuple(
+            node._replace(children=(), lazy=bool(node.children)) for node in nodes
+        )
+    return tuple(
+        node._replace(children=limit_depth(node.children, max_depth - 1))
+        for node in nodes
+    )
+
+
+EMPTY_MENU_TREE = MenuTree((), {})
+
+
+def _link_path(href):
+    """
+    Return the path of a local link, or None for links that can't be active.
+    Absolute URLs (external links, or page links when several sites are
+    served) are not indexed, since they may point to another host.
+    """
+    if href and href.startswith("/") and not href.startswith("//"):
+        return urlsplit(href).path
+    return None
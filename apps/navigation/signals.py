@@ -0,0 +1,65 @@
+"""
+Signal handlers that keep cached navigation in sync with the database.
+
+Menus are invalidated once the surrounding transaction commits, so that a
+request running concurrently with an editor's save can never cache the old
+data under the new version.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from wagtail.models import Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .cache import invalidate_menus
+from .models import Menu, MenuItem
+
+
+def invalidate_menus_on_commit(slugs):
+    slugs = set(slugs)
+    if slugs:
+        transaction.on_commit(lambda: invalidate_menus(slugs))
+
+
+@receiver(pre_save, sender=Menu)
+def invalidate_renamed_menu(sender, instance, **kwargs):
+    # A changed slug leaves the tree cached under the old slug behind
+    if instance.pk:
+        invalidate_menus_on_commit(
+            Menu.objects.filter(pk=instance.pk).values_list("slug", flat=True)
+        )
+
+
+@receiver(post_save, sender=Menu)
+@receiver(post_delete, sender=Menu)
+def invalidate_menu(sender, instance, **kwargs):
+    invalidate_menus_on_commit([instance.slug])
+
+
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+def invalidate_menu_of_item(sender, instance, **kwargs):
+    invalidate_menus_on_commit(
+        Menu.objects.filter(pk=instance.menu_id).values_list("slug", flat=True)
+    )
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def invalidate_menus_linking_to_page(sender, instance, **kwargs):
+    # Publishing, moving or renaming a page also changes the URLs of its
+    # descendants, so menus linking to any page in the subtree are stale
+    invalidate_menus_on_commit(
+        MenuItem.objects.filter(link_page__path__startswith=instance.path)
+        .values_list("menu__slug", flat=True)
+        .distinct()
+    )
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def invalidate_all_menus(sender, instance, **kwargs):
+    # Cached trees hold page URLs resolved against the site root paths
+    invalidate_menus_on_commit(Menu.objects.values_list("slug", flat=True))
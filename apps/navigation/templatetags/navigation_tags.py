@@ -1,11 +1,38 @@
 import logging
 from django import template
 from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from wagtail.models import Site
+from apps.navigation.cache import (
+    MENU_CACHE_TIMEOUT,
+    get_menu_version,
+    get_menu_versions,
+    menu_fragment_key,
+    menu_tree_key,
+    navigation_cache,
+)
 from apps.navigation.models import Menu
+from apps.navigation.nodes import EMPTY_MENU_TREE, NO_ACTIVE_TRAIL
 
 logger = logging.getLogger(__name__)
 register = template.Library()
 
+# Templates used to pre-render each menu variant
+MENU_FRAGMENT_TEMPLATES = {
+    "desktop": "navigation/desktop_menu.html",
+    "mobile": "navigation/mobile_menu.html",
+    "footer": "navigation/footer_menu.html",
+}
+
+# Templates rendering a single item (and its children) of each menu variant,
+# used for subtrees loaded on demand
+MENU_ITEM_TEMPLATES = {
+    "desktop": "navigation/menu_item.html",
+    "mobile": "navigation/mobile_menu_item.html",
+    "footer": "navigation/menu_item.html",
+}
+
 
 @register.simple_tag
 def get_menu(slug):
@@ -23,35 +50,202 @@ def get_menu(slug):
 
 
 @register.simple_tag
-def get_menu_tree(slug):
-    """
-    Returns the complete menu tree with nested structure for the given slug.
-    Includes caching for performance optimization.
-    """
-    # Try to get from cache first
-    cache_key = f"menu_tree_{slug}"
-    cached_result = cache.get(cache_key)
-    
-    if cached_result is not None:
-        return cached_result
-    
+def get_menu_tree(slug, max_depth=None):
+    """
+    Returns the root nodes of the menu tree for the given slug, each holding
+    its nested ``children``. See ``get_indexed_menu_tree`` for the arguments.
+
+    Usage: {% get_menu_tree "main-menu" as menu %}{% for item in menu %}
+    """
+    return get_indexed_menu_tree(slug, max_depth).nodes
+
+
+@register.simple_tag
+def get_indexed_menu_tree(slug, max_depth=None):
+    """
+    Returns the complete menu tree for the given slug as a ``MenuTree``: its
+    root nodes and the index its active trails are computed from. Trees are
+    cached under a versioned key that is bumped whenever the menu, its items
+    or a linked page change, so cached trees never expire on their own. A
+    process-local tier in front of the shared cache serves repeated reads
+    from memory.
+
+    With ``max_depth``, only that many levels are returned; deeper levels can
+    be loaded on demand from the ``navigation:menu_children`` view.
+    """
     try:
-        # Get menu with prefetched items
-        menu = Menu.objects.prefetch_related(
-            'menu_items__link_page',
-            'menu_items__children__link_page'
-        ).get(slug=slug)
-        result = menu.get_menu_tree()
-        
-        # Cache for 15 minutes (adjust as needed)
-        cache.set(cache_key, result, 900)
-        return result
-    except Menu.DoesNotExist:
-        logger.warning(f"Menu with slug '{slug}' does not exist")
-        return []
-    except Exception as e:
-        logger.error(f"Error retrieving menu tree for slug '{slug}': {str(e)}")
-        return []
+        tree = _load_menu_trees([slug])[slug]
+        return _limit_menu_depth(tree, slug, max_depth)
+    except Exception:
+        # Menus are rendered on every page, which a broken cache or database
+        # must not take down
+        logger.exception("Error retrieving menu tree for slug '%s'", slug)
+        return EMPTY_MENU_TREE
+
+
+@register.simple_tag(takes_context=True)
+def get_menu_trees(context, *slugs):
+    """
+    Returns the trees of several menus, keyed by slug, in one round trip: a
+    single ``get_many`` against the cache and, for menus missing from it, a
+    single database query. Trees are stashed on the request so that later
+    tags rendering the same menus reuse them.
+
+    Usage: {% get_menu_trees "main-menu" "footer-menu" "legal-menu" as menus %}
+    """
+    request = context.get("request")
+    trees = getattr(request, "_navigation_menu_trees", {})
+    missing = [slug for slug in slugs if slug not in trees]
+
+    if missing:
+        try:
+            trees.update(_load_menu_trees(missing))
+        except Exception:
+            logger.exception("Error retrieving menu trees for slugs %s", missing)
+            return {slug: trees.get(slug, EMPTY_MENU_TREE) for slug in slugs}
+        if request is not None:
+            request._navigation_menu_trees = trees
+
+    return {slug: trees[slug] for slug in slugs}
+
+
+@register.simple_tag(takes_context=True)
+def prefetch_menus(context, *slugs):
+    """
+    Loads the trees of several menus with ``get_menu_trees``, so that the
+    tags rendering them later in the page don't need a round trip each.
+    Outputs nothing.
+
+    Usage: {% prefetch_menus "main-menu" "footer-menu" "legal-menu" %}
+    """
+    get_menu_trees(context, *slugs)
+    return ""
+
+
+def _load_menu_trees(slugs):
+    """
+    Load menu trees through the process-local tier, falling back to the
+    shared cache and then the database for the ones it is missing.
+    """
+
+    def load(keys):
+        built = _get_cached_menu_trees([slug for _kind, slug in keys])
+        return {("tree", slug): tree for slug, tree in built.items()}
+
+    trees = navigation_cache.get_or_set_many([("tree", slug) for slug in slugs], load)
+    return {slug: tree for (_kind, slug), tree in trees.items()}
+
+
+def _limit_menu_depth(tree, slug, max_depth):
+    if max_depth is None:
+        return tree
+    return navigation_cache.get_or_set(
+        ("tree", slug, max_depth), lambda: tree.limit_depth(max_depth)
+    )
+
+
+def _get_cached_menu_trees(slugs):
+    versions = get_menu_versions(slugs)
+    cache_keys = {menu_tree_key(slug, versions[slug]): slug for slug in slugs}
+    trees = {cache_keys[key]: tree for key, tree in cache.get_many(cache_keys).items()}
+
+    missing = [slug for slug in slugs if slug not in trees]
+    if missing:
+        # The trees (including linked pages) are built from a single query
+        built = Menu.get_menu_trees(missing)
+        cache.set_many(
+            {menu_tree_key(slug, versions[slug]): tree for slug, tree in built.items()},
+            MENU_CACHE_TIMEOUT,
+        )
+        trees.update(built)
+
+    return trees
+
+
+@register.simple_tag(takes_context=True)
+def render_menu(context, slug, variant="desktop", max_depth=None):
+    """
+    Renders a menu with the template of the given variant (desktop, mobile
+    or footer), highlighting the trail to the current page. The rendered HTML
+    is cached per menu, site, variant, depth and active trail, and shares the
+    menu's version so it is invalidated together with the tree.
+
+    With ``max_depth``, only that many levels are rendered and deeper levels
+    are lazily loaded into Turbo Frames when their parent is expanded.
+
+    Usage: {% render_menu "main-menu" "desktop" max_depth=2 %}
+    """
+    request = context.get("request")
+    site = Site.find_for_request(request) if request else None
+    site_id = site.pk if site else None
+
+    if variant not in MENU_FRAGMENT_TEMPLATES:
+        logger.error(f"Unknown menu variant '{variant}' for slug '{slug}'")
+        return ""
+
+    tree = _limit_menu_depth(get_menu_trees(context, slug)[slug], slug, max_depth)
+    active = tree.get_active_trail(request.path) if request else NO_ACTIVE_TRAIL
+
+    html = navigation_cache.get_or_set(
+        ("fragment", slug, site_id, variant, max_depth, active.key),
+        lambda: _get_cached_menu_fragment(tree, slug, site, variant, max_depth, active),
+    )
+    return mark_safe(html)
+
+
+def _get_cached_menu_fragment(tree, slug, site, variant, max_depth, active):
+    cache_key = menu_fragment_key(
+        slug,
+        get_menu_version(slug),
+        site.pk if site else None,
+        variant,
+        max_depth,
+        active.key,
+    )
+    html = cache.get(cache_key)
+
+    if html is None:
+        html = render_to_string(
+            MENU_FRAGMENT_TEMPLATES[variant],
+            {
+                "navigation": tree.nodes,
+                "active": active,
+                "site": site,
+                "menu_slug": slug,
+                "max_depth": max_depth,
+            },
+        )
+        cache.set(cache_key, html, MENU_CACHE_TIMEOUT)
+
+    return html
+
+
+def warm_menu_tree(slug):
+    """
+    Build a menu's tree and store it in the shared cache, returning it. Used
+    by the ``warm_navigation`` command; rendering never needs to call this.
+    """
+    return _get_cached_menu_trees([slug])[slug]
+
+
+def warm_menu_fragments(tree, slug, sites, max_depth=None):
+    """
+    Render and store a menu's fragments for every site and variant, both
+    without an active trail and for every page the menu links to. Returns the
+    number of fragments stored.
+    """
+    tree = tree.limit_depth(max_depth)
+    trails = {NO_ACTIVE_TRAIL.key: NO_ACTIVE_TRAIL}
+    for path in tree.paths:
+        active = tree.get_active_trail(path)
+        trails.setdefault(active.key, active)
+
+    for site in sites:
+        for variant in MENU_FRAGMENT_TEMPLATES:
+            for active in trails.values():
+                _get_cached_menu_fragment(tree, slug, site, variant, max_depth, active)
+
+    return len(sites) * len(MENU_FRAGMENT_TEMPLATES) * len(trails)
 
 
 @register.simple_tag
@@ -59,7 +253,7 @@ def get_main_menu():
     """
     Convenience tag to get the main menu specifically.
     """
-    return get_menu_tree('main-menu')
+    return get_menu_tree("main-menu")
 
 
 @register.simple_tag
@@ -67,7 +261,7 @@ def get_footer_menu():
     """
     Convenience tag to get the footer menu specifically.
     """
-    return get_menu_tree('footer-menu')
+    return get_menu_tree("footer-menu")
 
 
 @register.simple_tag
@@ -75,4 +269,4 @@ def get_legal_menu():
     """
     Convenience tag to get the legal menu specifically.
     """
-    return get_menu_tree('legal-menu')
+    return get_menu_tree("legal-menu")
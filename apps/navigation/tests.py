@@ -1,3 +1,170 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from wagtail.models import Page, Site
+
+from .cache import menu_version_key, navigation_cache
+from .models import Menu, MenuItem
+from .nodes import EMPTY_MENU_TREE
+from .templatetags.navigation_tags import get_menu_tree, get_menu_trees
+
+# Keeps the tests off the database cache
+TEST_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class MenuChildrenViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        navigation_cache.invalidate()
+        self.menu = Menu.objects.create(title="Test", slug="test-menu")
+        self.parent = MenuItem.objects.create(
+            menu=self.menu, link_title="Parent", link_url="/parent/"
+        )
+        MenuItem.objects.create(
+            menu=self.menu, parent=self.parent, link_title="Child", link_url="/child/"
+        )
+
+    def test_children(self):
+        url = reverse("navigation:menu_children", args=["test-menu", self.parent.pk])
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "/child/")
+
+    def test_unknown_menu_is_not_cached(self):
+        url = reverse("navigation:menu_children", args=["no-such-menu", 1])
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertIsNone(cache.get(menu_version_key("no-such-menu")))
+        self.assertIsNone(navigation_cache.get(("tree", "no-such-menu")))
+
+
+@override_settings(CACHES=TEST_CACHES)
+class MenuTreeTagTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        navigation_cache.invalidate()
+        menu = Menu.objects.create(title="Test", slug="test-menu")
+        parent = MenuItem.objects.create(
+            menu=menu, link_title="Parent", link_url="/parent/"
+        )
+        MenuItem.objects.create(
+            menu=menu, parent=parent, link_title="Child", link_url="/child/"
+        )
+
+    def render(self, template):
+        return Template("{% load navigation_tags %}" + template).render(Context())
+
+    def test_get_menu_tree_iterates_over_nodes(self):
+        html = self.render(
+            '{% get_menu_tree "test-menu" as menu %}'
+            "{% for item in menu %}{{ item.title }}:"
+            "{% for child in item.children %}{{ child.title }}{% endfor %}"
+            "{% endfor %}"
+        )
+        self.assertEqual(html, "Parent:Child")
+
+    def test_get_indexed_menu_tree(self):
+        html = self.render(
+            '{% get_indexed_menu_tree "test-menu" max_depth=1 as tree %}'
+            "{% for item in tree.nodes %}{{ item.title }} {{ item.lazy }}{% endfor %}"
+        )
+        self.assertEqual(html, "Parent True")
+
+    def test_prefetch_menus(self):
+        request = RequestFactory().get("/")
+        html = Template(
+            '{% load navigation_tags %}{% prefetch_menus "test-menu" "footer-menu" %}'
+        ).render(Context({"request": request}))
+
+        self.assertEqual(html, "")
+        self.assertEqual(
+            set(request._navigation_menu_trees), {"test-menu", "footer-menu"}
+        )
+
+    def test_cache_errors_return_empty_menus(self):
+        context = Context({"request": RequestFactory().get("/")})
+        with (
+            mock.patch.object(cache, "get_many", side_effect=RuntimeError),
+            self.assertLogs("apps.navigation.templatetags.navigation_tags", "ERROR"),
+        ):
+            trees = get_menu_trees(context, "test-menu")
+            nodes = get_menu_tree("test-menu")
+
+        self.assertEqual(trees, {"test-menu": EMPTY_MENU_TREE})
+        self.assertEqual(nodes, ())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class MenuInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        navigation_cache.invalidate()
+        self.menu = Menu.objects.create(title="Test", slug="test-menu")
+        self.item = MenuItem.objects.create(
+            menu=self.menu, link_title="About", link_url="/about/"
+        )
+
+    def get_titles(self, slug="test-menu"):
+        return [node.title for node in get_menu_tree(slug)]
+
+    def test_item_changes_invalidate_on_commit(self):
+        self.assertEqual(self.get_titles(), ["About"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.item.link_title = "About us"
+            self.item.save()
+            # Until the change commits, the cached tree is served
+            self.assertEqual(self.get_titles(), ["About"])
+
+        self.assertEqual(self.get_titles(), ["About us"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            MenuItem.objects.create(
+                menu=self.menu, link_title="Contact", link_url="/contact/"
+            )
+        self.assertEqual(self.get_titles(), ["About us", "Contact"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.item.delete()
+        self.assertEqual(self.get_titles(), ["Contact"])
+
+    def test_uncommitted_changes_do_not_invalidate(self):
+        self.get_titles()
+        version = cache.get(menu_version_key("test-menu"))
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.item.link_title = "About us"
+            self.item.save()
+
+        self.assertTrue(callbacks)
+        self.assertEqual(cache.get(menu_version_key("test-menu")), version)
+
+    def test_renamed_menu_invalidates_old_slug(self):
+        self.assertEqual(self.get_titles(), ["About"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.menu.slug = "renamed-menu"
+            self.menu.save()
+
+        self.assertEqual(self.get_titles("test-menu"), [])
+        self.assertEqual(self.get_titles("renamed-menu"), ["About"])
+
+    def test_published_page_invalidates_menus_linking_to_it(self):
+        home = Site.objects.get(is_default_site=True).root_page
+        page = home.add_child(instance=Page(title="Team", slug="team"))
+        MenuItem.objects.create(menu=self.menu, link_title="Team", link_page=page)
+        self.assertIn(page.url, [node.href for node in get_menu_tree("test-menu")])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page.slug = "people"
+            page.save_revision().publish()
+
+        hrefs = [node.href for node in get_menu_tree("test-menu")]
+        self.assertIn("/people/", hrefs)
+        self.assertNotIn("/team/", hrefs)
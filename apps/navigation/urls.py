@@ -0,0 +1,13 @@
+from django.urls import path
+
+from . import views
+
+app_name = "navigation"
+
+urlpatterns = [
+    path(
+        "<slug:slug>/items/<int:item_id>/children/",
+        views.menu_children,
+        name="menu_children",
+    ),
+]
@@ -1,3 +1,62 @@
+from urllib.parse import urlsplit
+
+from django.http import Http404
 from django.shortcuts import render
+from django.views.decorators.http import require_GET
+
+from .cache import navigation_cache
+from .models import MENU_MAX_DEPTH, Menu
+from .nodes import limit_depth
+from .templatetags.navigation_tags import MENU_ITEM_TEMPLATES, get_indexed_menu_tree
+
+
+@require_GET
+def menu_children(request, slug, item_id):
+    """
+    Render the children of a menu item inside a Turbo Frame. Menus rendered
+    with ``max_depth`` point the frames of their deepest items here, so deeper
+    levels are only loaded when a visitor expands them.
+
+    Query parameters: ``variant`` (the menu template variant) and ``depth``
+    (how many levels to render before deferring again).
+    """
+    variant = request.GET.get("variant", "desktop")
+    if variant not in MENU_ITEM_TEMPLATES:
+        raise Http404("Unknown menu variant")
+
+    try:
+        max_depth = min(max(int(request.GET.get("depth", 1)), 1), MENU_MAX_DEPTH)
+    except ValueError:
+        max_depth = 1
+
+    # Loading a tree caches it, even an empty one, so unknown slugs must not
+    # get that far
+    if not Menu.objects.filter(slug=slug).exists():
+        raise Http404("Menu not found")
+
+    tree = get_indexed_menu_tree(slug)
+    children = tree.get_children(item_id)
+    if children is None:
+        raise Http404("Menu item not found")
+
+    # Frames are fetched from the page the menu is on, which is what the
+    # active trail has to be computed for
+    current_path = urlsplit(request.headers.get("Referer", "")).path
+    active = tree.get_active_trail(current_path)
 
-# Create your views here.
+    nodes = navigation_cache.get_or_set(
+        ("children", slug, item_id, max_depth),
+        lambda: limit_depth(children, max_depth),
+    )
+    return render(
+        request,
+        "navigation/menu_children.html",
+        {
+            "frame_id": f"menu-item-{item_id}-{variant}",
+            "navigation": nodes,
+            "item_template": MENU_ITEM_TEMPLATES[variant],
+            "active": active,
+            "menu_slug": slug,
+            "max_depth": max_depth,
+        },
+    )
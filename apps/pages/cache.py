@@ -0,0 +1,164 @@
+"""
+Cached snapshots of showcase pages.
+
+Showcase pages are rendered from a snapshot of their section/item/link tree:
+plain, JSON-compatible data with the linked pages' URLs and the images'
+renditions already resolved. Snapshots are materialised when a showcase page
+is published (or on first read) and stored under a versioned key, like menu
+trees; anything they depend on changing bumps the version. The further pages
+of items of paginated sections and the pages of ids listed for each tag
+are stored separately, under the same version, and built when they are first
+requested.
+"""
+
+import uuid
+
+from django.core.cache import cache
+from django.http import HttpRequest
+from wagtail.images import get_image_model
+from wagtail.models import Site
+
+from apps.core.cache import LocalCache
+
+# Snapshots are invalidated through signals, so they never need to expire
+SHOWCASE_SNAPSHOT_TIMEOUT = None
+
+# URL parts of entity pages, keyed by everything the URL is derived from:
+# publishing a new slug, moving a page (which rewrites the url_path of its
+# subtree) or switching its URL type yields a new key, and site changes
+# invalidate the whole cache. Entries are process-local, as a shared cache
+# round trip costs more than computing a URL
+page_url_cache = LocalCache("page_urls", max_size=4096, timeout=60 * 60)
+
+
+def showcase_version_key(page_id):
+    return f"showcase_version_{page_id}"
+
+
+def showcase_snapshot_key(page_id, version):
+    return f"showcase_snapshot_{page_id}_{version}"
+
+
+def showcase_items_key(page_id, version, section_id, number):
+    return f"showcase_items_{page_id}_{version}_{section_id}_{number}"
+
+
+def showcase_tag_key(page_id, version, slug, number):
+    return f"showcase_tag_{page_id}_{version}_{slug}_{number}"
+
+
+def get_showcase_version(page_id):
+    """
+    Return the current version token for a showcase page, creating one if
+    needed.
+    """
+    key = showcase_version_key(page_id)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        # Another worker may have created a token in the meantime
+        if not cache.add(key, version, SHOWCASE_SNAPSHOT_TIMEOUT):
+            version = cache.get(key, version)
+    return version
+
+
+def get_showcase_snapshot(page):
+    """
+    Return the snapshot of a live showcase page, building and storing it if
+    it is not cached yet.
+    """
+    version = get_showcase_version(page.pk)
+    snapshot = cache.get(showcase_snapshot_key(page.pk, version))
+    if snapshot is None:
+        snapshot = page.build_snapshot()
+        cache.set(
+            showcase_snapshot_key(page.pk, version),
+            snapshot,
+            SHOWCASE_SNAPSHOT_TIMEOUT,
+        )
+    return snapshot
+
+
+def get_showcase_items_snapshot(page, section_id, number):
+    """
+    Return the snapshot of page ``number`` of the items of a paginated
+    section of a live showcase page, or None if there is no such page.
+    Stored under the version of the showcase page, so it is invalidated
+    along with the page's snapshot.
+    """
+    version = get_showcase_version(page.pk)
+    key = showcase_items_key(page.pk, version, section_id, number)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = page.build_items_snapshot(section_id, number)
+        if snapshot is not None:
+            cache.set(key, snapshot, SHOWCASE_SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def get_showcase_tag_listing(page, slug, number=1):
+    """
+    Return page ``number`` of the tag with ``slug`` and the ids of the live
+    entity pages of a showcase page tagged with it, or None if there is no
+    such tag or page. Stored under the version of the showcase page, which
+    is bumped when entity pages under it are published, unpublished, moved
+    or deleted.
+    """
+    version = get_showcase_version(page.pk)
+    key = showcase_tag_key(page.pk, version, slug, number)
+    listing = cache.get(key)
+    if listing is None:
+        listing = page.build_tag_listing(slug, number)
+        if listing is not None:
+            cache.set(key, listing, SHOWCASE_SNAPSHOT_TIMEOUT)
+    return listing
+
+
+def invalidate_showcases(page_ids):
+    """
+    Bump the version of the given showcase pages so their snapshots are
+    rebuilt.
+    """
+    page_ids = set(page_ids)
+    if page_ids:
+        cache.set_many(
+            {showcase_version_key(pk): uuid.uuid4().hex for pk in page_ids},
+            SHOWCASE_SNAPSHOT_TIMEOUT,
+        )
+
+
+def get_image_snapshot(image, filter_spec):
+    """
+    Serialise the rendition of ``image`` for ``filter_spec``. Only the file
+    name is stored: storage URLs may be signed and expire, so they are added
+    by ``add_image_urls`` when the snapshot is read.
+    """
+    rendition = image.get_rendition(filter_spec)
+    return {
+        "file": rendition.file.name,
+        "width": rendition.width,
+        "height": rendition.height,
+        "alt": rendition.alt,
+    }
+
+
+def add_image_urls(items):
+    """Add the storage URL of the image of every item in a snapshot, in place."""
+    storage = get_image_model().get_rendition_model()._meta.get_field("file").storage
+    for item in items:
+        if item.get("image"):
+            item["image"]["url"] = storage.url(item["image"]["file"])
+    return items
+
+
+def get_page_url_parts_key(page, request=None):
+    """
+    Return the ``page_url_cache`` key of the URL parts of ``page``, as seen
+    from the site of ``request``.
+    """
+    site_id = None
+    if isinstance(request, HttpRequest):
+        # Wagtail keeps the site found for a request on the request
+        site = Site.find_for_request(request)
+        site_id = site.pk if site else None
+    return (page.pk, site_id, page.url_path, page.url_type_preference)
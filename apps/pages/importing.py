@@ -0,0 +1,311 @@
+"""
+Bulk import of showcase entities.
+
+Records are read lazily from CSV or JSONL files and imported in batches,
+each in its own transaction. Every record becomes an entity page under a
+showcase page (unless the showcase lists resources, which have no pages)
+and an item, with its links, in one of the showcase's sections.
+
+Creating pages through ``add_child`` and ``save_revision`` looks up the last
+child, updates the parent and writes, then publishes, a revision for every
+page. Here the tree paths, url paths and slugs of a batch are computed up
+front from a single look at the parent, pages are saved live with the
+minimal number of queries, their revisions, items and links are bulk
+created, and ``page_published`` is sent for the live pages so that caches
+depending on them are invalidated as for pages published by editors.
+"""
+
+import csv
+import json
+import time
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import F, Max
+from django.utils import timezone
+from django.utils.text import slugify
+from wagtail.models import Page, Revision
+from wagtail.signals import page_published
+
+from .cache import invalidate_showcases
+from .models import ShowcaseItem, ShowcaseItemLink, ShowcaseSection, Tag
+
+# Columns of CSV files holding a record's single link
+CSV_LINK_COLUMNS = {"link_title": "title", "link_url": "url", "link_target": "target"}
+
+TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+
+
+class InvalidRecord(ValueError):
+    """Raised for records that cannot be imported."""
+
+
+class UnpublishedChanges(ValueError):
+    """Raised for showcase pages with a draft that the import would replace."""
+
+
+def read_jsonl(file):
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_csv(file):
+    for row in csv.DictReader(file):
+        record = {key: value for key, value in row.items() if value not in ("", None)}
+        link = {
+            field: record.pop(column)
+            for column, field in CSV_LINK_COLUMNS.items()
+            if column in record
+        }
+        if link:
+            record["links"] = [link]
+        yield record
+
+
+def read_records(file, format):
+    """Yield the records of an open CSV or JSONL ``file``, one at a time."""
+    readers = {"csv": read_csv, "jsonl": read_jsonl}
+    return readers[format](file)
+
+
+def parse_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+class ShowcaseImporter:
+    """
+    Import records into a showcase page. Each record is a dict with a
+    ``title`` and optionally a ``slug``, ``description``, ``section``
+    (heading, defaults to ``default_section``), ``tag`` (name, created if
+    missing), ``live`` (defaults to true), ``url_type_preference``,
+    ``has_page`` (project pages), ``image`` (image id, portfolio items) and
+    ``links`` (a list of dicts with a ``title``, ``url`` and ``target``).
+    """
+
+    def __init__(self, showcase, default_section="Imported"):
+        if showcase.has_unpublished_changes and showcase.latest_revision_id:
+            # The revision saved after the import is built from the database
+            # rows, so it would replace the draft
+            raise UnpublishedChanges(
+                f"Publish or discard the draft of {showcase.title!r} before importing"
+            )
+        self.showcase = showcase
+        self.entity_model = showcase.entity_model
+        self.default_section = default_section
+        self.tags = {tag.name: tag for tag in Tag.objects.all()}
+        self.sections = {
+            section.heading: section
+            for section in ShowcaseSection.objects.filter(showcase_page=showcase)
+        }
+        self.section_order = len(self.sections)
+        self.item_orders = dict(
+            ShowcaseItem.objects.filter(section__showcase_page=showcase)
+            .values("section_id")
+            .annotate(last=Max("sort_order"))
+            .values_list("section_id", "last")
+        )
+        self.slugs = set(showcase.get_children().values_list("slug", flat=True))
+        self.url_types = set()
+        if self.entity_model is not None:
+            field = self.entity_model._meta.get_field("url_type_preference")
+            self.url_types = {value for value, _label in field.choices}
+        self.imported = 0
+
+    def run(self, records, batch_size=500, report=None):
+        """
+        Import ``records`` in batches of ``batch_size``, calling
+        ``report(count, seconds)`` after each batch, then save a revision of
+        the showcase so that editing it keeps the imported sections. Returns
+        the number of records.
+
+        The revision is saved even if a batch fails, as the batches before
+        it are committed: publishing a revision without their items would
+        delete them.
+        """
+        records = iter(records)
+        try:
+            while batch := list(islice(records, batch_size)):
+                start = time.perf_counter()
+                with transaction.atomic():
+                    self.import_batch(batch)
+                self.imported += len(batch)
+                if report:
+                    report(len(batch), time.perf_counter() - start)
+        finally:
+            if self.imported:
+                with transaction.atomic():
+                    self.save_showcase_revision()
+        return self.imported
+
+    def save_showcase_revision(self):
+        """
+        Save a revision of the showcase page with its sections as they are
+        in the database. Publishing it would rewrite every section, item and
+        link with the values they already have, so a live showcase's revision
+        is only marked as live and its snapshots invalidated.
+        """
+        showcase = (
+            type(self.showcase)
+            .objects.prefetch_related("showcase_sections__items__links")
+            .get(pk=self.showcase.pk)
+        )
+        revision = showcase.save_revision(clean=False)
+        if showcase.live:
+            Page.objects.filter(pk=showcase.pk).update(
+                live_revision=revision, has_unpublished_changes=False
+            )
+            transaction.on_commit(lambda: invalidate_showcases([showcase.pk]))
+
+    def import_batch(self, records):
+        for index, record in enumerate(records, start=self.imported + 1):
+            if not record.get("title"):
+                raise InvalidRecord(f"Record {index} has no title")
+            url_type = record.get("url_type_preference")
+            if (
+                self.url_types
+                and url_type is not None
+                and url_type not in self.url_types
+            ):
+                raise InvalidRecord(
+                    f"Record {index} has an unknown url_type_preference {url_type!r}"
+                )
+            for link in record.get("links") or []:
+                if not link.get("url"):
+                    raise InvalidRecord(f"Record {index} has a link without a url")
+
+        now = timezone.now()
+        pages = []
+        if self.entity_model is not None:
+            pages = self.create_pages(records, now)
+
+        items = []
+        links = []
+        for index, record in enumerate(records):
+            section = self.get_section(record.get("section") or self.default_section)
+            item = ShowcaseItem(
+                section=section,
+                title=record["title"][:200],
+                description=record.get("description", ""),
+                page=pages[index] if pages else None,
+                image_id=(
+                    record.get("image")
+                    if self.showcase.showcase_type == "portfolio"
+                    else None
+                ),
+                sort_order=self.next_item_order(section),
+            )
+            items.append(item)
+            for order, link in enumerate(record.get("links") or []):
+                links.append(
+                    ShowcaseItemLink(
+                        item=item,
+                        title=link.get("title") or link["url"],
+                        url=link["url"],
+                        target=link.get("target") or "_self",
+                        sort_order=order,
+                    )
+                )
+
+        ShowcaseItem.objects.bulk_create(items)
+        ShowcaseItemLink.objects.bulk_create(links)
+
+    def create_pages(self, records, now):
+        """
+        Save an entity page for every record, in order, as the next children
+        of the showcase page, with a revision, live for live pages, and send
+        ``page_published`` for the live ones.
+        """
+        parent = self.showcase
+        last_child = parent.get_last_child()
+        position = last_child._get_lastpos_in_path() if last_child else 0
+        pages = []
+
+        for record in records:
+            live = parse_bool(record.get("live", True))
+            position += 1
+            page = self.entity_model(
+                title=record["title"][:255],
+                draft_title=record["title"][:255],
+                slug=self.get_slug(record.get("slug") or record["title"]),
+                path=parent._get_path(parent.path, parent.depth + 1, position),
+                depth=parent.depth + 1,
+                locale_id=parent.locale_id,
+                live=live,
+                has_unpublished_changes=not live,
+                first_published_at=now if live else None,
+                last_published_at=now if live else None,
+                tag=self.get_tag(record.get("tag")),
+                url_type_preference=record.get("url_type_preference", "seo"),
+            )
+            if "has_page" in record and hasattr(page, "has_page"):
+                page.has_page = parse_bool(record["has_page"])
+            if record.get("image") and hasattr(page, "image_id"):
+                page.image_id = record["image"]
+            # Saves the url path computed from the parent without loading it
+            page._cached_parent_obj = parent
+            page.save(clean=False, log_action=None)
+            pages.append(page)
+
+        Page.objects.filter(pk=parent.pk).update(numchild=F("numchild") + len(pages))
+        parent.numchild += len(pages)
+
+        revisions = Revision.objects.bulk_create(
+            Revision(
+                content_object=page,
+                base_content_type=page.get_base_content_type(),
+                created_at=now,
+                content=page.serializable_data(),
+                object_str=str(page),
+            )
+            for page in pages
+        )
+        for page, revision in zip(pages, revisions):
+            page.latest_revision = revision
+            page.latest_revision_created_at = now
+            if page.live:
+                page.live_revision = revision
+        Page.objects.bulk_update(
+            pages, ["latest_revision", "latest_revision_created_at", "live_revision"]
+        )
+
+        for page, revision in zip(pages, revisions):
+            if page.live:
+                page_published.send(
+                    sender=page.specific_class, instance=page, revision=revision
+                )
+        return pages
+
+    def get_slug(self, value):
+        base = slugify(value)[:240] or "page"
+        slug, suffix = base, 2
+        while slug in self.slugs:
+            slug, suffix = f"{base}-{suffix}", suffix + 1
+        self.slugs.add(slug)
+        return slug
+
+    def get_tag(self, name):
+        if not name:
+            return None
+        if name not in self.tags:
+            self.tags[name] = tag = Tag(name=name)
+            tag.save()
+        return self.tags[name]
+
+    def get_section(self, heading):
+        if heading not in self.sections:
+            self.sections[heading] = ShowcaseSection.objects.create(
+                showcase_page=self.showcase,
+                showcase_type=self.showcase.showcase_type,
+                heading=heading[:200],
+                sort_order=self.section_order,
+            )
+            self.section_order += 1
+        return self.sections[heading]
+
+    def next_item_order(self, section):
+        order = self.item_orders.get(section.pk, -1) + 1
+        self.item_orders[section.pk] = order
+        return order
@@ -0,0 +1,125 @@
+"""
+Shared fixtures and helpers for the pages benchmark commands.
+"""
+
+import random
+
+from wagtail.models import Page
+
+from apps.core.benchmark import Rollback, measure
+from apps.pages.models import (
+    PortfolioShowcasePage,
+    ProjectPage,
+    ProjectShowcasePage,
+    ResourceShowcasePage,
+    ServiceShowcasePage,
+    ShowcaseItem,
+    ShowcaseItemLink,
+    ShowcaseSection,
+    Tag,
+)
+
+__all__ = [
+    "Rollback",
+    "create_benchmark_entities",
+    "create_benchmark_showcases",
+    "measure",
+]
+
+SHOWCASE_PAGE_MODELS = [
+    ProjectShowcasePage,
+    ServiceShowcasePage,
+    PortfolioShowcasePage,
+    ResourceShowcasePage,
+]
+
+
+def create_benchmark_showcases(sections, items, links):
+    """
+    Create one showcase page of every type under the root page, each with
+    ``sections`` sections of ``items`` items with ``links`` links. All items
+    that can link to a page link to the same entity page, which is returned
+    along with the showcases.
+    """
+    root = Page.get_first_root_node()
+    showcases = [
+        root.add_child(
+            instance=model(
+                title=f"Benchmark {model._meta.verbose_name}",
+                slug=f"benchmark-{model.showcase_type}-showcase",
+            )
+        )
+        for model in SHOWCASE_PAGE_MODELS
+    ]
+    target = showcases[0].add_child(
+        instance=ProjectPage(title="Benchmark project", slug="benchmark-project")
+    )
+
+    for showcase in showcases:
+        section_rows = ShowcaseSection.objects.bulk_create(
+            ShowcaseSection(
+                showcase_page=showcase,
+                showcase_type=showcase.showcase_type,
+                heading=f"Section {index}",
+                sort_order=index,
+            )
+            for index in range(sections)
+        )
+        item_rows = ShowcaseItem.objects.bulk_create(
+            ShowcaseItem(
+                section=section,
+                title=f"Item {index}",
+                page=target if showcase.showcase_type != "resource" else None,
+                sort_order=index,
+            )
+            for section in section_rows
+            for index in range(items)
+        )
+        ShowcaseItemLink.objects.bulk_create(
+            ShowcaseItemLink(
+                item=item,
+                title=f"Link {index}",
+                url=f"https://example.com/{index}/",
+                sort_order=index,
+            )
+            for item in item_rows
+            for index in range(links)
+        )
+
+    return showcases, target
+
+
+def create_benchmark_entities(pages, tags, showcases):
+    """
+    Create ``showcases`` project showcase pages under the root page, with
+    ``pages`` project pages spread evenly over them, each tagged with one of
+    ``tags`` tags at random. About one page in ten is left as a draft.
+    Returns the showcases and the tags.
+    """
+    rng = random.Random(0)
+    root = Page.get_first_root_node()
+    showcase_pages = [
+        root.add_child(
+            instance=ProjectShowcasePage(
+                title=f"Benchmark projects {index}",
+                slug=f"benchmark-projects-{index}",
+            )
+        )
+        for index in range(showcases)
+    ]
+    tag_rows = Tag.objects.bulk_create(
+        Tag(name=f"Benchmark tag {index}", slug=f"benchmark-tag-{index}")
+        for index in range(tags)
+    )
+
+    for index in range(pages):
+        showcase_pages[index % showcases].add_child(
+            instance=ProjectPage(
+                title=f"Project {index}",
+                slug=f"project-{index}",
+                tag=rng.choice(tag_rows),
+                live=rng.random() >= 0.1,
+            )
+        )
+
+    return showcase_pages, tag_rows
@@ -0,0 +1,97 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from wagtail.models import Page
+
+from apps.pages.importing import ShowcaseImporter
+from apps.pages.models import ProjectPage, ProjectShowcasePage
+
+from ._benchmark import Rollback
+
+
+def benchmark_records(count, tags):
+    for index in range(count):
+        yield {
+            "title": f"Imported project {index}",
+            "description": f"Description of project {index}",
+            "section": f"Section {index % 5}",
+            "tag": f"Benchmark tag {index % tags}",
+            "live": index % 10 != 0,
+            "links": [
+                {"title": "Website", "url": f"https://example.com/{index}/"},
+            ],
+        }
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput of importing synthetic project records into "
+        "a showcase page with the bulk importer, against creating the pages "
+        "one by one with add_child and publishing a revision of each. All "
+        "fixtures are created inside a transaction that is rolled back "
+        "afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--entities",
+            type=int,
+            default=10000,
+            help="Number of records imported in bulk",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=int,
+            default=200,
+            help="Number of pages created one by one",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of records imported per transaction",
+        )
+        parser.add_argument(
+            "--tags",
+            type=int,
+            default=20,
+            help="Number of tags the records are tagged with",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'method':<12} {'records':>8} {'s':>8} {'records/s':>10}")
+        try:
+            with transaction.atomic():
+                root = Page.get_first_root_node()
+                showcase = root.add_child(
+                    instance=ProjectShowcasePage(
+                        title="Benchmark import", slug="benchmark-import"
+                    )
+                )
+
+                start = time.perf_counter()
+                for record in benchmark_records(options["baseline"], options["tags"]):
+                    page = showcase.add_child(
+                        instance=ProjectPage(
+                            title=f"Baseline {record['title']}", live=False
+                        )
+                    )
+                    page.save_revision().publish()
+                self.report("add_child", options["baseline"], start)
+
+                start = time.perf_counter()
+                ShowcaseImporter(showcase).run(
+                    benchmark_records(options["entities"], options["tags"]),
+                    options["batch_size"],
+                )
+                self.report("import", options["entities"], start)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def report(self, method, count, start):
+        seconds = time.perf_counter() - start
+        self.stdout.write(
+            f"{method:<12} {count:>8} {seconds:>8.2f} {count / seconds:>10.0f}"
+        )
@@ -0,0 +1,82 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from wagtail.models import Page
+
+from apps.pages.signals import get_showcases_linking_to
+
+from ._benchmark import Rollback, create_benchmark_showcases, measure
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure query count and time of lookups spanning all showcase types "
+        "and of the cascades run when pages are deleted, for synthetic "
+        "showcases of every type. All fixtures are created inside a "
+        "transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sections",
+            type=int,
+            default=3,
+            help="Number of sections per showcase page",
+        )
+        parser.add_argument(
+            "--items",
+            type=int,
+            default=10,
+            help="Number of items per section",
+        )
+        parser.add_argument(
+            "--links",
+            type=int,
+            default=1,
+            help="Number of links per item",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of lookups; the best time is reported",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'operation':<28} {'queries':>8} {'ms':>8}")
+        try:
+            with transaction.atomic():
+                showcases, target = create_benchmark_showcases(
+                    options["sections"], options["items"], options["links"]
+                )
+                self.report(
+                    "items linking to a page",
+                    measure(
+                        lambda: get_showcases_linking_to(page=target),
+                        options["repeat"],
+                    ),
+                )
+                self.report(
+                    "items linking to a subtree",
+                    measure(
+                        lambda: get_showcases_linking_to(
+                            page__path__startswith=target.path
+                        ),
+                        options["repeat"],
+                    ),
+                )
+                # Deleting can only be measured once per fixture
+                self.report(
+                    "delete linked page",
+                    measure(lambda: Page.objects.get(pk=target.pk).delete(), 1),
+                )
+                self.report(
+                    "delete showcase page",
+                    measure(lambda: Page.objects.get(pk=showcases[0].pk).delete(), 1),
+                )
+                raise Rollback
+        except Rollback:
+            pass
+
+    def report(self, operation, measurement):
+        queries, ms = measurement
+        self.stdout.write(f"{operation:<28} {queries:>8} {ms:>8.2f}")
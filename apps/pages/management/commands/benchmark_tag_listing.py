@@ -0,0 +1,89 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.pages.cache import get_showcase_tag_listing
+
+from ._benchmark import Rollback, create_benchmark_entities, measure
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure query count and time of tag filtered showcase listings for "
+        "synthetic project pages: scanning the live pages of the showcase, "
+        "the indexed query, and the cached id list, for the first page of the "
+        "listing. All fixtures are created inside a transaction that is rolled "
+        "back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=10000,
+            help="Number of project pages",
+        )
+        parser.add_argument(
+            "--tags",
+            type=int,
+            default=20,
+            help="Number of tags the pages are tagged with",
+        )
+        parser.add_argument(
+            "--showcases",
+            type=int,
+            default=2,
+            help="Number of showcase pages the project pages are spread over",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of listings per method; the best time is reported",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                start = time.perf_counter()
+                showcases, tags = create_benchmark_entities(
+                    options["pages"], options["tags"], options["showcases"]
+                )
+                self.stdout.write(
+                    f"Created {options['pages']} pages in "
+                    f"{time.perf_counter() - start:.1f} s"
+                )
+                showcase, tag = showcases[0], tags[0]
+
+                def scan():
+                    return [
+                        page.pk
+                        for page in showcase.get_children().live().specific()
+                        if page.tag_id == tag.pk
+                    ][: showcase.tag_page_size]
+
+                def cached():
+                    return get_showcase_tag_listing(showcase, tag.slug)
+
+                listing = showcase.build_tag_listing(tag.slug)
+                cached()
+
+                self.stdout.write(
+                    f"{'listing':<10} {'pages':>6} {'queries':>8} {'ms':>8}"
+                )
+                for name, func in [
+                    ("scan", scan),
+                    ("indexed", lambda: showcase.build_tag_listing(tag.slug)),
+                    ("cached", cached),
+                ]:
+                    queries, ms = measure(func, options["repeat"])
+                    self.stdout.write(
+                        f"{name:<10} {len(listing['page_ids']):>6} {queries:>8} {ms:>8.2f}"
+                    )
+
+                self.stdout.write("\nQuery plan of the indexed listing:")
+                self.stdout.write(showcase.get_entities().filter(tag=tag).explain())
+                raise Rollback
+        except Rollback:
+            pass
@@ -0,0 +1,81 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+from wagtail.models import Page
+
+from apps.pages.importing import ShowcaseImporter, UnpublishedChanges, read_records
+from apps.pages.models import AbstractShowcasePage
+
+
+class Command(BaseCommand):
+    help = (
+        "Import showcase entities from a CSV or JSONL file into a showcase "
+        "page: an entity page (except for resources) and a showcase item "
+        "with its links for every record. Records are streamed and imported "
+        "in batches, each in its own transaction. Reports the throughput of "
+        "every batch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("showcase", type=int, help="Id of the showcase page")
+        parser.add_argument("path", help="CSV or JSONL file to import")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="Format of the file (defaults to its extension)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of records imported per transaction",
+        )
+        parser.add_argument(
+            "--section",
+            default="Imported",
+            help="Heading of the section of records without a section",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        format = options["format"] or path.suffix.lstrip(".").lower()
+        if format not in ("csv", "jsonl"):
+            raise CommandError("Pass --format for files not ending in .csv or .jsonl")
+
+        showcase = Page.objects.filter(pk=options["showcase"]).first()
+        if showcase is None or not issubclass(
+            showcase.specific_class, AbstractShowcasePage
+        ):
+            raise CommandError(f"Page {options['showcase']} is not a showcase page")
+        showcase = showcase.specific
+        try:
+            importer = ShowcaseImporter(showcase, default_section=options["section"])
+        except UnpublishedChanges as error:
+            raise CommandError(str(error)) from error
+        start = time.perf_counter()
+
+        def report(count, seconds):
+            self.stdout.write(
+                f"{importer.imported:>8} records  {count / seconds:>8.0f} records/s"
+            )
+
+        try:
+            with path.open(newline="", encoding="utf-8") as file:
+                imported = importer.run(
+                    read_records(file, format), options["batch_size"], report
+                )
+        # Invalid records and malformed files raise ValueError
+        except (ValueError, IntegrityError) as error:
+            raise CommandError(
+                f"Import stopped after {importer.imported} records: {error}"
+            ) from error
+
+        seconds = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported} records into {showcase.title!r} in "
+                f"{seconds:.2f} s ({imported / seconds:.0f} records/s)"
+            )
+        )
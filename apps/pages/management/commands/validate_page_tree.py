@@ -0,0 +1,61 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.db.models.functions import Length, Substr
+from wagtail.models import Page, get_page_models
+
+
+def get_invalid_children(model):
+    """
+    Return the pages whose parent is a page of type ``model`` but which could
+    not be created there: their type is not an allowed subpage type, or the
+    parent's data does not accept child pages (``accepts_subpages_filter``).
+    Runs a single query.
+    """
+    allowed = ContentType.objects.get_for_models(
+        *model.allowed_subpage_models(), for_concrete_models=False
+    )
+    # Match the exact page type, as querying a model also returns its subclasses
+    parents = model.objects.filter(
+        content_type=ContentType.objects.get_for_model(model, for_concrete_model=False)
+    )
+    invalid = ~Q(content_type__in=allowed.values())
+
+    accepts_subpages_filter = getattr(model, "accepts_subpages_filter", None)
+    if accepts_subpages_filter is not None:
+        invalid |= Q(
+            parent_path__in=parents.exclude(accepts_subpages_filter).values("path")
+        )
+
+    return (
+        Page.objects.annotate(
+            parent_path=Substr("path", 1, Length("path") - Page.steplen)
+        )
+        .filter(parent_path__in=parents.values("path"))
+        .filter(invalid)
+        .order_by("path")
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that every page in the tree could be created where it is, "
+        "according to the page type rules and to the data of its parent, "
+        "such as project pages without a page of their own. Runs one query "
+        "per page type and fails if any page is misplaced."
+    )
+
+    def handle(self, *args, **options):
+        invalid = 0
+        for model in get_page_models():
+            for page in get_invalid_children(model):
+                invalid += 1
+                self.stdout.write(
+                    f"{page.url_path} ({page.specific_class._meta.verbose_name}, "
+                    f"id {page.pk}) is not allowed under a "
+                    f"{model._meta.verbose_name}"
+                )
+
+        if invalid:
+            raise CommandError(f"Found {invalid} misplaced page(s)")
+        self.stdout.write(self.style.SUCCESS("All pages are allowed where they are"))
@@ -0,0 +1,198 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:29
+
+import django.db.models.deletion
+import modelcluster.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pages", "0006_delete_resourcepage"),
+        ("wagtailcore", "0094_alter_page_locale"),
+        ("wagtailimages", "0027_image_description"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShowcaseSection",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sort_order",
+                    models.IntegerField(blank=True, editable=False, null=True),
+                ),
+                (
+                    "showcase_type",
+                    models.CharField(
+                        choices=[
+                            ("project", "Project"),
+                            ("service", "Service"),
+                            ("portfolio", "Portfolio"),
+                            ("resource", "Resource"),
+                        ],
+                        editable=False,
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "heading",
+                    models.CharField(
+                        help_text="Heading for this section", max_length=200
+                    ),
+                ),
+                (
+                    "description",
+                    models.TextField(
+                        blank=True, help_text="Optional description for this section"
+                    ),
+                ),
+                (
+                    "showcase_page",
+                    modelcluster.fields.ParentalKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="showcase_sections",
+                        to="wagtailcore.page",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Showcase Section",
+                "verbose_name_plural": "Showcase Sections",
+                "ordering": ["sort_order"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ShowcaseItem",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sort_order",
+                    models.IntegerField(blank=True, editable=False, null=True),
+                ),
+                (
+                    "title",
+                    models.CharField(
+                        default="Untitled",
+                        help_text="Title for this item",
+                        max_length=200,
+                    ),
+                ),
+                (
+                    "description",
+                    models.TextField(blank=True, help_text="Description for this item"),
+                ),
+                (
+                    "image",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="wagtailimages.image",
+                    ),
+                ),
+                (
+                    "page",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Optional page to link to",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "section",
+                    modelcluster.fields.ParentalKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="items",
+                        to="pages.showcasesection",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Showcase Item",
+                "verbose_name_plural": "Showcase Items",
+                "ordering": ["sort_order"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ShowcaseItemLink",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sort_order",
+                    models.IntegerField(blank=True, editable=False, null=True),
+                ),
+                ("title", models.CharField(max_length=200)),
+                ("url", models.URLField()),
+                (
+                    "target",
+                    models.CharField(
+                        choices=[("_self", "Same Window"), ("_blank", "New Window")],
+                        default="_self",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "item",
+                    modelcluster.fields.ParentalKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="links",
+                        to="pages.showcaseitem",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Showcase Item Link",
+                "verbose_name_plural": "Showcase Item Links",
+                "ordering": ["sort_order"],
+                "abstract": False,
+                "indexes": [
+                    models.Index(
+                        fields=["item", "sort_order"], name="pages_link_item_order_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="showcasesection",
+            index=models.Index(
+                fields=["showcase_page", "sort_order"],
+                name="pages_section_page_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="showcaseitem",
+            index=models.Index(
+                fields=["section", "sort_order"], name="pages_item_section_order_idx"
+            ),
+        ),
+    ]
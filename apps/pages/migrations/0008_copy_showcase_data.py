@@ -0,0 +1,180 @@
+from django.db import migrations
+
+# Showcase type -> model name prefix of its original tables
+SHOWCASE_TYPES = {
+    "project": "Project",
+    "service": "Service",
+    "portfolio": "Portfolio",
+    "resource": "Resource",
+}
+
+
+def copy_rows(source, target, fields, **extra):
+    """
+    Copy every row of ``source`` into ``target`` and return a dict of old to
+    new primary keys. ``extra`` maps target fields to callables taking the
+    source row.
+    """
+    pks = {}
+    for row in source.objects.order_by("pk"):
+        values = {field: getattr(row, field) for field in fields}
+        values.update({field: value(row) for field, value in extra.items()})
+        pks[row.pk] = target.objects.create(**values).pk
+    return pks
+
+
+def convert_revisions(apps, relation, convert):
+    """
+    Rewrite the sections stored in the revisions of every showcase page, so
+    that drafts and history keep their sections after the move.
+    """
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Revision = apps.get_model("wagtailcore", "Revision")
+
+    for showcase_type, prefix in SHOWCASE_TYPES.items():
+        content_types = ContentType.objects.filter(
+            app_label="pages", model=f"{prefix.lower()}showcasepage"
+        )
+        for revision in Revision.objects.filter(content_type__in=content_types):
+            old_key, new_key = relation(showcase_type)
+            if old_key in revision.content:
+                sections = revision.content.pop(old_key)
+                revision.content[new_key] = convert(showcase_type, sections)
+                revision.save(update_fields=["content"])
+
+
+def forwards(apps, schema_editor):
+    ShowcaseSection = apps.get_model("pages", "ShowcaseSection")
+    ShowcaseItem = apps.get_model("pages", "ShowcaseItem")
+    ShowcaseItemLink = apps.get_model("pages", "ShowcaseItemLink")
+    new_pks = {}
+
+    for showcase_type, prefix in SHOWCASE_TYPES.items():
+        Section = apps.get_model("pages", f"{prefix}ShowcaseSection")
+        Item = apps.get_model("pages", f"{prefix}ShowcaseItem")
+        Link = apps.get_model("pages", f"{prefix}ShowcaseItemLink")
+
+        sections = copy_rows(
+            Section,
+            ShowcaseSection,
+            ["showcase_page_id", "sort_order", "heading", "description"],
+            showcase_type=lambda row, t=showcase_type: t,
+        )
+        item_fields = ["sort_order", "title", "description"]
+        if showcase_type != "resource":
+            item_fields.append("page_id")
+        if showcase_type == "portfolio":
+            item_fields.append("image_id")
+        items = copy_rows(
+            Item,
+            ShowcaseItem,
+            item_fields,
+            section_id=lambda row, pks=sections: pks[row.section_id],
+        )
+        links = copy_rows(
+            Link,
+            ShowcaseItemLink,
+            ["sort_order", "title", "url", "target"],
+            item_id=lambda row, pks=items: pks[row.item_id],
+        )
+        new_pks[showcase_type] = (sections, items, links)
+
+    def convert(showcase_type, sections):
+        section_pks, item_pks, link_pks = new_pks[showcase_type]
+        for section in sections:
+            section["pk"] = section_pks.get(section.get("pk"))
+            section["showcase_type"] = showcase_type
+            for item in section.get("items", []):
+                item["pk"] = item_pks.get(item.get("pk"))
+                item["section"] = section["pk"]
+                for link in item.get("links", []):
+                    link["pk"] = link_pks.get(link.get("pk"))
+                    link["item"] = item["pk"]
+        return sections
+
+    convert_revisions(
+        apps,
+        lambda showcase_type: (f"{showcase_type}_sections", "showcase_sections"),
+        convert,
+    )
+
+
+def backwards(apps, schema_editor):
+    ShowcaseSection = apps.get_model("pages", "ShowcaseSection")
+    ShowcaseItem = apps.get_model("pages", "ShowcaseItem")
+    ShowcaseItemLink = apps.get_model("pages", "ShowcaseItemLink")
+    old_pks = {}
+
+    for showcase_type, prefix in SHOWCASE_TYPES.items():
+        Section = apps.get_model("pages", f"{prefix}ShowcaseSection")
+        Item = apps.get_model("pages", f"{prefix}ShowcaseItem")
+        Link = apps.get_model("pages", f"{prefix}ShowcaseItemLink")
+
+        sections = {}
+        for row in ShowcaseSection.objects.filter(showcase_type=showcase_type):
+            sections[row.pk] = Section.objects.create(
+                showcase_page_id=row.showcase_page_id,
+                sort_order=row.sort_order,
+                heading=row.heading,
+                description=row.description,
+            ).pk
+        items = {}
+        for row in ShowcaseItem.objects.filter(section_id__in=sections):
+            values = {}
+            if showcase_type != "resource":
+                values["page_id"] = row.page_id
+            if showcase_type == "portfolio":
+                values["image_id"] = row.image_id
+            items[row.pk] = Item.objects.create(
+                section_id=sections[row.section_id],
+                sort_order=row.sort_order,
+                title=row.title,
+                description=row.description,
+                **values,
+            ).pk
+        links = {}
+        for row in ShowcaseItemLink.objects.filter(item_id__in=items):
+            links[row.pk] = Link.objects.create(
+                item_id=items[row.item_id],
+                sort_order=row.sort_order,
+                title=row.title,
+                url=row.url,
+                target=row.target,
+            ).pk
+        old_pks[showcase_type] = (sections, items, links)
+
+    def convert(showcase_type, sections):
+        section_pks, item_pks, link_pks = old_pks[showcase_type]
+        for section in sections:
+            section["pk"] = section_pks.get(section.get("pk"))
+            section.pop("showcase_type", None)
+            for item in section.get("items", []):
+                item["pk"] = item_pks.get(item.get("pk"))
+                item["section"] = section["pk"]
+                if showcase_type == "resource":
+                    item.pop("page", None)
+                if showcase_type != "portfolio":
+                    item.pop("image", None)
+                for link in item.get("links", []):
+                    link["pk"] = link_pks.get(link.get("pk"))
+                    link["item"] = item["pk"]
+        return sections
+
+    convert_revisions(
+        apps,
+        lambda showcase_type: ("showcase_sections", f"{showcase_type}_sections"),
+        convert,
+    )
+    # Items and links are deleted along with their sections
+    ShowcaseSection.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pages", "0007_showcasesection_showcaseitem_showcaseitemlink"),
+        ("wagtailcore", "0094_alter_page_locale"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
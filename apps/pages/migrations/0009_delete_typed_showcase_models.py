@@ -0,0 +1,100 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:31
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pages", "0008_copy_showcase_data"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="portfolioshowcaseitemlink",
+            name="item",
+        ),
+        migrations.RemoveField(
+            model_name="portfolioshowcasesection",
+            name="showcase_page",
+        ),
+        migrations.RemoveField(
+            model_name="projectshowcaseitem",
+            name="page",
+        ),
+        migrations.RemoveField(
+            model_name="projectshowcaseitem",
+            name="section",
+        ),
+        migrations.RemoveField(
+            model_name="projectshowcaseitemlink",
+            name="item",
+        ),
+        migrations.RemoveField(
+            model_name="projectshowcasesection",
+            name="showcase_page",
+        ),
+        migrations.RemoveField(
+            model_name="resourceshowcaseitem",
+            name="section",
+        ),
+        migrations.RemoveField(
+            model_name="resourceshowcaseitemlink",
+            name="item",
+        ),
+        migrations.RemoveField(
+            model_name="resourceshowcasesection",
+            name="showcase_page",
+        ),
+        migrations.RemoveField(
+            model_name="serviceshowcaseitem",
+            name="page",
+        ),
+        migrations.RemoveField(
+            model_name="serviceshowcaseitem",
+            name="section",
+        ),
+        migrations.RemoveField(
+            model_name="serviceshowcaseitemlink",
+            name="item",
+        ),
+        migrations.RemoveField(
+            model_name="serviceshowcasesection",
+            name="showcase_page",
+        ),
+        migrations.DeleteModel(
+            name="PortfolioShowcaseItem",
+        ),
+        migrations.DeleteModel(
+            name="PortfolioShowcaseItemLink",
+        ),
+        migrations.DeleteModel(
+            name="PortfolioShowcaseSection",
+        ),
+        migrations.DeleteModel(
+            name="ProjectShowcaseItem",
+        ),
+        migrations.DeleteModel(
+            name="ProjectShowcaseItemLink",
+        ),
+        migrations.DeleteModel(
+            name="ProjectShowcaseSection",
+        ),
+        migrations.DeleteModel(
+            name="ResourceShowcaseItem",
+        ),
+        migrations.DeleteModel(
+            name="ResourceShowcaseItemLink",
+        ),
+        migrations.DeleteModel(
+            name="ResourceShowcaseSection",
+        ),
+        migrations.DeleteModel(
+            name="ServiceShowcaseItem",
+        ),
+        migrations.DeleteModel(
+            name="ServiceShowcaseItemLink",
+        ),
+        migrations.DeleteModel(
+            name="ServiceShowcaseSection",
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:36
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pages", "0009_delete_typed_showcase_models"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="showcasesection",
+            name="page_size",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="Optional number of items shown when the page loads; further items are loaded as visitors scroll. Leave empty to show all items.",
+                null=True,
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_tag_slugs(apps, schema_editor):
+    Tag = apps.get_model("pages", "Tag")
+    used = set()
+    for tag in Tag.objects.order_by("pk"):
+        base = slugify(tag.name)[:90] or "tag"
+        slug, suffix = base, 2
+        while slug in used:
+            slug, suffix = f"{base}-{suffix}", suffix + 1
+        used.add(slug)
+        tag.slug = slug
+        tag.save(update_fields=["slug"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pages", "0010_showcasesection_page_size"),
+        ("wagtailimages", "0027_image_description"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="slug",
+            field=models.SlugField(blank=True, max_length=100),
+        ),
+        migrations.RunPython(populate_tag_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="tag",
+            name="slug",
+            field=models.SlugField(
+                blank=True,
+                help_text="Used to filter showcase pages by this tag (?tag=slug). Generated from the name if left empty.",
+                max_length=100,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="portfolioitempage",
+            name="tag",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="pages.tag",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectpage",
+            name="tag",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="pages.tag",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="servicepage",
+            name="tag",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="pages.tag",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="portfolioitempage",
+            index=models.Index(
+                fields=["tag", "flexpage_ptr"], name="portfolioitempage_tag_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectpage",
+            index=models.Index(
+                fields=["tag", "flexpage_ptr"], name="projectpage_tag_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="servicepage",
+            index=models.Index(
+                fields=["tag", "flexpage_ptr"], name="servicepage_tag_idx"
+            ),
+        ),
+    ]
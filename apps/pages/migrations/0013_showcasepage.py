@@ -0,0 +1,415 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:29
+
+import uuid
+
+import django.db.models.deletion
+import modelcluster.fields
+from django.db import migrations, models
+
+SHOWCASE_MODELS = [
+    "PortfolioShowcasePage",
+    "ProjectShowcasePage",
+    "ResourceShowcasePage",
+    "ServiceShowcasePage",
+]
+
+SHOWCASE_FIELDS = [
+    "canonical_url",
+    "custom_structured_data",
+    "introduction",
+    "og_image_id",
+    "uuid",
+]
+
+
+def copy_showcase_pages(apps, schema_editor):
+    """
+    Move the fields of the showcase types to the table of their new base,
+    keeping the ids of their pages, which become the ids of the base rows.
+    """
+    ShowcasePage = apps.get_model("pages", "ShowcasePage")
+    for model_name in SHOWCASE_MODELS:
+        model = apps.get_model("pages", model_name)
+        for row in model.objects.order_by("pk"):
+            values = {field: getattr(row, field) for field in SHOWCASE_FIELDS}
+            # Raw saves leave the wagtailcore_page row alone
+            ShowcasePage(page_ptr_id=row.pk, **values).save_base(raw=True)
+
+
+def copy_showcase_pages_back(apps, schema_editor):
+    """
+    Copy the fields of the showcase types back to their own tables.
+    """
+    ShowcasePage = apps.get_model("pages", "ShowcasePage")
+    rows = {
+        row["page_ptr_id"]: row
+        for row in ShowcasePage.objects.values("page_ptr_id", *SHOWCASE_FIELDS)
+    }
+    for model_name in SHOWCASE_MODELS:
+        model = apps.get_model("pages", model_name)
+        for pk in model.objects.values_list("pk", flat=True):
+            values = {field: rows[pk][field] for field in SHOWCASE_FIELDS}
+            model.objects.filter(pk=pk).update(**values)
+
+
+# The showcase types now inherit from ShowcasePage, which the autodetector
+# can't express: their state is recreated on the new base, keeping their
+# table, whose page_ptr_id column becomes showcasepage_ptr_id.
+#
+# Their uuid columns lose their unique constraint before the data is copied,
+# so that when migrating backwards they can be added back, with the same
+# default for every row, and filled before the constraint is restored.
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pages", "0012_alter_flexpage_body"),
+        ("wagtailcore", "0094_alter_page_locale"),
+        ("wagtailimages", "0027_image_description"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShowcasePage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "canonical_url",
+                    models.URLField(
+                        blank=True,
+                        help_text="Leave blank to use the page's URL.",
+                        max_length=255,
+                        verbose_name="Canonical URL",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                (
+                    "custom_structured_data",
+                    models.TextField(
+                        blank=True,
+                        help_text="Additional structured data for this page in JSON-LD format.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "introduction",
+                    models.TextField(
+                        blank=True,
+                        help_text="Optional introduction text for the showcase page",
+                    ),
+                ),
+                (
+                    "og_image",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Shown when linking to this page on social media. If blank, may show an image from the page, or the default from Settings > SEO.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="wagtailimages.image",
+                        verbose_name="Preview image",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Showcase Page",
+                "verbose_name_plural": "Showcase Pages",
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.AlterField(
+            model_name="portfolioshowcasepage",
+            name="uuid",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name="projectshowcasepage",
+            name="uuid",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name="resourceshowcasepage",
+            name="uuid",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name="serviceshowcasepage",
+            name="uuid",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, null=True),
+        ),
+        migrations.RunPython(copy_showcase_pages, copy_showcase_pages_back),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RemoveField(
+                    model_name="portfolioshowcasepage",
+                    name="canonical_url",
+                ),
+                migrations.RemoveField(
+                    model_name="portfolioshowcasepage",
+                    name="custom_structured_data",
+                ),
+                migrations.RemoveField(
+                    model_name="portfolioshowcasepage",
+                    name="introduction",
+                ),
+                migrations.RemoveField(
+                    model_name="portfolioshowcasepage",
+                    name="og_image",
+                ),
+                migrations.RemoveField(
+                    model_name="portfolioshowcasepage",
+                    name="uuid",
+                ),
+            ],
+            state_operations=[
+                migrations.DeleteModel(
+                    name="PortfolioShowcasePage",
+                ),
+                migrations.CreateModel(
+                    name="PortfolioShowcasePage",
+                    fields=[
+                        (
+                            "showcasepage_ptr",
+                            models.OneToOneField(
+                                auto_created=True,
+                                db_column="page_ptr_id",
+                                on_delete=django.db.models.deletion.CASCADE,
+                                parent_link=True,
+                                primary_key=True,
+                                serialize=False,
+                                to="pages.showcasepage",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Portfolio Showcase Page",
+                        "verbose_name_plural": "Portfolio Showcase Pages",
+                    },
+                    bases=("pages.showcasepage",),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="portfolioshowcasepage",
+            name="showcasepage_ptr",
+            field=models.OneToOneField(
+                auto_created=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                parent_link=True,
+                primary_key=True,
+                serialize=False,
+                to="pages.showcasepage",
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RemoveField(
+                    model_name="projectshowcasepage",
+                    name="canonical_url",
+                ),
+                migrations.RemoveField(
+                    model_name="projectshowcasepage",
+                    name="custom_structured_data",
+                ),
+                migrations.RemoveField(
+                    model_name="projectshowcasepage",
+                    name="introduction",
+                ),
+                migrations.RemoveField(
+                    model_name="projectshowcasepage",
+                    name="og_image",
+                ),
+                migrations.RemoveField(
+                    model_name="projectshowcasepage",
+                    name="uuid",
+                ),
+            ],
+            state_operations=[
+                migrations.DeleteModel(
+                    name="ProjectShowcasePage",
+                ),
+                migrations.CreateModel(
+                    name="ProjectShowcasePage",
+                    fields=[
+                        (
+                            "showcasepage_ptr",
+                            models.OneToOneField(
+                                auto_created=True,
+                                db_column="page_ptr_id",
+                                on_delete=django.db.models.deletion.CASCADE,
+                                parent_link=True,
+                                primary_key=True,
+                                serialize=False,
+                                to="pages.showcasepage",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Project Showcase Page",
+                        "verbose_name_plural": "Project Showcase Pages",
+                    },
+                    bases=("pages.showcasepage",),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="projectshowcasepage",
+            name="showcasepage_ptr",
+            field=models.OneToOneField(
+                auto_created=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                parent_link=True,
+                primary_key=True,
+                serialize=False,
+                to="pages.showcasepage",
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RemoveField(
+                    model_name="resourceshowcasepage",
+                    name="canonical_url",
+                ),
+                migrations.RemoveField(
+                    model_name="resourceshowcasepage",
+                    name="custom_structured_data",
+                ),
+                migrations.RemoveField(
+                    model_name="resourceshowcasepage",
+                    name="introduction",
+                ),
+                migrations.RemoveField(
+                    model_name="resourceshowcasepage",
+                    name="og_image",
+                ),
+                migrations.RemoveField(
+                    model_name="resourceshowcasepage",
+                    name="uuid",
+                ),
+            ],
+            state_operations=[
+                migrations.DeleteModel(
+                    name="ResourceShowcasePage",
+                ),
+                migrations.CreateModel(
+                    name="ResourceShowcasePage",
+                    fields=[
+                        (
+                            "showcasepage_ptr",
+                            models.OneToOneField(
+                                auto_created=True,
+                                db_column="page_ptr_id",
+                                on_delete=django.db.models.deletion.CASCADE,
+                                parent_link=True,
+                                primary_key=True,
+                                serialize=False,
+                                to="pages.showcasepage",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Resource Showcase Page",
+                        "verbose_name_plural": "Resource Showcase Pages",
+                    },
+                    bases=("pages.showcasepage",),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="resourceshowcasepage",
+            name="showcasepage_ptr",
+            field=models.OneToOneField(
+                auto_created=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                parent_link=True,
+                primary_key=True,
+                serialize=False,
+                to="pages.showcasepage",
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RemoveField(
+                    model_name="serviceshowcasepage",
+                    name="canonical_url",
+                ),
+                migrations.RemoveField(
+                    model_name="serviceshowcasepage",
+                    name="custom_structured_data",
+                ),
+                migrations.RemoveField(
+                    model_name="serviceshowcasepage",
+                    name="introduction",
+                ),
+                migrations.RemoveField(
+                    model_name="serviceshowcasepage",
+                    name="og_image",
+                ),
+                migrations.RemoveField(
+                    model_name="serviceshowcasepage",
+                    name="uuid",
+                ),
+            ],
+            state_operations=[
+                migrations.DeleteModel(
+                    name="ServiceShowcasePage",
+                ),
+                migrations.CreateModel(
+                    name="ServiceShowcasePage",
+                    fields=[
+                        (
+                            "showcasepage_ptr",
+                            models.OneToOneField(
+                                auto_created=True,
+                                db_column="page_ptr_id",
+                                on_delete=django.db.models.deletion.CASCADE,
+                                parent_link=True,
+                                primary_key=True,
+                                serialize=False,
+                                to="pages.showcasepage",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Service Showcase Page",
+                        "verbose_name_plural": "Service Showcase Pages",
+                    },
+                    bases=("pages.showcasepage",),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="serviceshowcasepage",
+            name="showcasepage_ptr",
+            field=models.OneToOneField(
+                auto_created=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                parent_link=True,
+                primary_key=True,
+                serialize=False,
+                to="pages.showcasepage",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="showcasesection",
+            name="showcase_page",
+            field=modelcluster.fields.ParentalKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="showcase_sections",
+                to="pages.showcasepage",
+            ),
+        ),
+    ]
@@ -1,13 +1,45 @@
+from urllib.parse import urlsplit, urlunsplit
 from django.db import models
+from django.db.models import F, Prefetch, Q, Window
+from django.db.models.functions import Coalesce, RowNumber
 from django.core.exceptions import ValidationError
-from wagtail.fields import StreamField
+from django.core.validators import MinValueValidator, slug_re
+from django.http import Http404
+from django.utils.text import slugify
 from wagtail.admin.panels import FieldPanel, InlinePanel
-from wagtail.models import Orderable
+from wagtail.images import get_image_model
+from wagtail.models import Orderable, Page
 from wagtail.snippets.models import register_snippet
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
 from apps.core.models import BasePage
 from apps.blocks.models import ContentStreamBlock
+from apps.blocks.compiled import get_body_blocks
+from apps.blocks.fields import LazyStreamField
+from .cache import (
+    add_image_urls,
+    get_image_snapshot,
+    get_page_url_parts_key,
+    get_showcase_snapshot,
+    get_showcase_tag_listing,
+    page_url_cache,
+)
+
+# Rendition of the linked pages' images shown on portfolio showcase cards
+PORTFOLIO_CARD_RENDITION = "fill-300x200"
+
+
+def accepts_subpages(page):
+    """
+    Whether child pages may be created under or moved to ``page``, on top of
+    the page type rules. Page types whose rules depend on their data declare
+    an ``accepts_subpages`` method, and a matching ``accepts_subpages_filter``
+    used to validate the whole tree in bulk.
+    """
+    # Wagtail passes the specific parent from the admin, so this rarely
+    # queries; a deferred instance only loads the fields the check reads
+    check = getattr(page.specific_deferred, "accepts_subpages", None)
+    return check is None or check()
 
 
 class FlexPage(BasePage):
@@ -16,8 +48,9 @@ class FlexPage(BasePage):
     It uses a StreamField for maximum content flexibility.
     """
 
-    # Main content area as a StreamField for flexible content
-    body = StreamField(
+    # Main content area as a StreamField for flexible content, parsed on first
+    # access so that listings and route lookups don't pay for it
+    body = LazyStreamField(
         ContentStreamBlock(),
         use_json_field=True,
         blank=True,
@@ -31,11 +64,35 @@ class FlexPage(BasePage):
     settings_panels = BasePage.settings_panels
 
     # Allow only one instance at the root level
-    parent_page_types = ["wagtailcore.Page", "pages.FlexPage"]
+    parent_page_types = [
+        "wagtailcore.Page",
+        "pages.FlexPage",
+        "pages.ProjectPage",
+        "pages.ServicePage",
+        "pages.PortfolioItemPage",
+    ]
 
     # Specify the template for this page
     template = "pages/flex_page.html"
 
+    # Store the rendered body on publish, see apps.blocks.compiled
+    compile_body = True
+
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        # The compiled body, or the whole body with the snippets and images
+        # resolved up front, with one query per model, rather than per block
+        # type and nesting level
+        context["body_blocks"] = get_body_blocks(self, request)
+        return context
+
+    @classmethod
+    def can_create_at(cls, parent):
+        return super().can_create_at(parent) and accepts_subpages(parent)
+
+    def can_move_to(self, parent):
+        return super().can_move_to(parent) and accepts_subpages(parent)
+
     class Meta:
         verbose_name = "Flex Page"
         verbose_name_plural = "Flex Pages"
@@ -49,16 +106,34 @@ class Tag(models.Model):
     """
 
     name = models.CharField(max_length=100, unique=True)
+    slug = models.SlugField(
+        max_length=100,
+        unique=True,
+        blank=True,
+        help_text=(
+            "Used to filter showcase pages by this tag (?tag=slug). "
+            "Generated from the name if left empty."
+        ),
+    )
     description = models.TextField(blank=True)
 
     panels = [
         FieldPanel("name"),
+        FieldPanel("slug"),
         FieldPanel("description"),
     ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            base = slugify(self.name)[:90] or "tag"
+            self.slug, suffix = base, 2
+            while Tag.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
+                self.slug, suffix = f"{base}-{suffix}", suffix + 1
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = "Tag"
         verbose_name_plural = "Tags"
@@ -78,6 +153,8 @@ class BaseEntityPage(FlexPage):
         null=True,
         blank=True,
         related_name="+",
+        # Covered by the tag index in Meta.indexes
+        db_index=False,
     )
 
     URL_TYPE_CHOICES = [
@@ -101,12 +178,30 @@ class BaseEntityPage(FlexPage):
 
     class Meta:
         abstract = True
+        indexes = [
+            # Tag filtered listings read the matching pages from this index
+            # alone, then check live and path on wagtailcore_page by primary key
+            models.Index(fields=["tag", "flexpage_ptr"], name="%(class)s_tag_idx"),
+        ]
 
-    def get_url_parts(self, request=None, current_site=None):
+    def get_url_parts(self, request=None):
+        """
+        Return the URL parts built by ``build_url_parts``, memoized in
+        ``page_url_cache`` so that pages listed or linked many times per
+        render don't recompute them.
+        """
+        if self.pk is None:
+            return self.build_url_parts(request)
+        return page_url_cache.get_or_set(
+            get_page_url_parts_key(self, request),
+            lambda: self.build_url_parts(request),
+        )
+
+    def build_url_parts(self, request=None):
         """
         Override URL generation to support both SEO-friendly and UUID-based URLs.
         """
-        url_parts = super().get_url_parts(request, current_site)
+        url_parts = super().get_url_parts(request=request)
         if url_parts is None:
             return None
 
@@ -122,17 +217,20 @@ class BaseEntityPage(FlexPage):
 
         return url_parts
 
-    def get_uuid_url(self):
+    def get_uuid_url(self, request=None):
         """
-        Get the UUID-based URL for this page.
+        Get the UUID-based URL for this page, under its parent's URL. The
+        parent's URL is this page's URL without the last segment, so no
+        query is needed to find it.
         """
-        if self.uuid:
-            # Get the parent URL and append the UUID
-            if self.get_parent():
-                parent_url = self.get_parent().specific.get_url()
-                return f"{parent_url}uuid/{self.uuid}/"
-            return f"/uuid/{self.uuid}/"
-        return "#"
+        if not self.uuid:
+            return "#"
+        url = self.get_url(request=request)
+        if url is None:
+            return "#"
+        scheme, netloc, path, _query, _fragment = urlsplit(url)
+        parent_path = path.rstrip("/").rsplit("/", 1)[0]
+        return urlunsplit((scheme, netloc, f"{parent_path}/uuid/{self.uuid}/", "", ""))
 
 
 class ProjectPage(BaseEntityPage):
@@ -152,20 +250,20 @@ class ProjectPage(BaseEntityPage):
     subpage_types = ["pages.FlexPage"]  # Only if has_page is True
     template = "pages/project_page.html"
 
+    # Project pages matching this filter accept child pages, see accepts_subpages
+    accepts_subpages_filter = Q(has_page=True)
+
+    def accepts_subpages(self):
+        return self.has_page
+
     def clean(self):
-        # If has_page is False, ensure no child pages exist
-        if not self.has_page and self.get_children().exists():
+        super().clean()
+        # If has_page is False, ensure no child pages exist. numchild is kept
+        # up to date by treebeard, so this does not need a query
+        if not self.has_page and self.numchild:
             raise ValidationError("Cannot have child pages when 'has_page' is False.")
 
-    def save(self, *args, **kwargs):
-        # Update subpage_types based on has_page value
-        if self.has_page:
-            self.subpage_types = ["pages.FlexPage"]
-        else:
-            self.subpage_types = []
-        super().save(*args, **kwargs)
-
-    class Meta:
+    class Meta(BaseEntityPage.Meta):
         verbose_name = "Project Page"
         verbose_name_plural = "Project Pages"
 
@@ -186,11 +284,7 @@ class ServicePage(BaseEntityPage):
     subpage_types = ["pages.FlexPage"]
     template = "pages/service_page.html"
 
-    def save(self, *args, **kwargs):
-        # Services always have pages, so we don't need to modify subpage_types
-        super().save(*args, **kwargs)
-
-    class Meta:
+    class Meta(BaseEntityPage.Meta):
         verbose_name = "Service Page"
         verbose_name_plural = "Service Pages"
 
@@ -216,11 +310,35 @@ class PortfolioItemPage(BaseEntityPage):
     subpage_types = ["pages.FlexPage"]
     template = "pages/portfolio_item_page.html"
 
-    class Meta:
+    class Meta(BaseEntityPage.Meta):
         verbose_name = "Portfolio Item Page"
         verbose_name_plural = "Portfolio Item Pages"
 
 
+def showcase_sections_panel(item_panels):
+    """
+    The sections editor of a showcase page. All showcase types store their
+    sections and items in the same tables; the item fields editors get for
+    each type are chosen by ``item_panels``.
+    """
+    return InlinePanel(
+        "showcase_sections",
+        label="Sections",
+        help_text="Add and order sections to display on this page",
+        panels=[
+            FieldPanel("heading"),
+            FieldPanel("description"),
+            FieldPanel("page_size"),
+            InlinePanel(
+                "items",
+                label="Items",
+                help_text="Add items to this section",
+                panels=item_panels,
+            ),
+        ],
+    )
+
+
 class AbstractShowcasePage(BasePage):
     """
     Abstract base page for showcasing different types of entities.
@@ -232,27 +350,266 @@ class AbstractShowcasePage(BasePage):
         blank=True, help_text="Optional introduction text for the showcase page"
     )
 
+    # Stored on the sections of the page, see ShowcaseSection.showcase_type
+    showcase_type = None
+
+    # Template of a single item, used by the page and by the items of
+    # paginated sections loaded on demand
+    item_template = "pages/showcase_item.html"
+
+    # Type of the entity pages under this page, which visitors can filter by
+    # tag (?tag=slug)
+    entity_model = None
+
+    # Number of entity pages per page of a tag listing (?tag=slug&page=n)
+    tag_page_size = 24
+
     class Meta:
         abstract = True
         verbose_name = "Abstract Showcase Page"
         verbose_name_plural = "Abstract Showcase Pages"
 
+    def get_items_queryset(self):
+        """
+        Items with their links and linked pages, ordered for display.
+        """
+        return (
+            ShowcaseItem.objects.order_by("sort_order")
+            .select_related("page")
+            .prefetch_related(
+                Prefetch(
+                    "links", queryset=ShowcaseItemLink.objects.order_by("sort_order")
+                )
+            )
+        )
+
+    def get_sections(self):
+        """
+        Get the sections of this page with the items shown when the page is
+        rendered: all items, or the first ``page_size`` items (plus one, which
+        tells whether there are more) of paginated sections. Items, their
+        links and linked pages are loaded up front, in three queries
+        regardless of the number of sections, items and links.
+        """
+        sections = self.showcase_sections.order_by("sort_order")
+        if self.showcase_sections.is_deferring:
+            # Unsaved changes (e.g. in a preview) only exist in memory
+            return sections
+
+        # Number the items of each section, so that only the first page of
+        # paginated sections is fetched
+        items = self.get_items_queryset().alias(
+            position=Window(
+                RowNumber(), partition_by=F("section"), order_by=F("sort_order").asc()
+            )
+        )
+        items = items.filter(
+            position__lte=Coalesce(F("section__page_size"), F("position")) + 1
+        )
+        sections = list(sections.prefetch_related(Prefetch("items", queryset=items)))
+        self.resolve_items(
+            [item for section in sections for item in section.get_items()]
+        )
+        return sections
+
+    def get_section_items(self, section_id, number):
+        """
+        Get page ``number`` of the items of a paginated section of this page,
+        plus the first item of the next page if there is one. Returns None if
+        the section isn't paginated or the page is out of range.
+        """
+        section = self.showcase_sections.filter(
+            pk=section_id, page_size__isnull=False
+        ).first()
+        if section is None or number < 1:
+            return None
+
+        start = (number - 1) * section.page_size
+        items = list(
+            self.get_items_queryset().filter(section=section)[
+                start : start + section.page_size + 1
+            ]
+        )
+        if not items:
+            return None
+        self.resolve_items(items)
+        return section, items
+
+    def resolve_items(self, items):
+        """
+        Load whatever else the snapshots of ``items`` need, in bulk. Called
+        with the items of ``get_sections`` and ``get_section_items``.
+        """
 
-class ProjectShowcasePage(AbstractShowcasePage):
+    def get_entities(self):
+        """
+        Get the live entity pages under this page, in tree order.
+        """
+        return (
+            self.entity_model.objects.child_of(self)
+            .live()
+            .defer_streamfields()
+            .order_by("path")
+        )
+
+    def build_snapshot(self):
+        """
+        Serialise the sections of this page, with their items, links, linked
+        page URLs and images, into plain JSON-compatible data. Paginated
+        sections only include their first page, see ``build_items_snapshot``.
+        Also lists the tags of the entity pages, to filter them by.
+        """
+        tags = []
+        if self.entity_model is not None and self.pk is not None:
+            tags = [
+                {"name": tag.name, "slug": tag.slug}
+                for tag in Tag.objects.filter(pk__in=self.get_entities().values("tag"))
+            ]
+        return {
+            "tags": tags,
+            "sections": [
+                {
+                    "id": section.pk,
+                    "heading": section.heading,
+                    "description": section.description,
+                    **self.paginate_items(section, list(section.get_items()), 1),
+                }
+                for section in self.get_sections()
+            ],
+        }
+
+    def build_items_snapshot(self, section_id, number):
+        """
+        Serialise page ``number`` of the items of a paginated section, like
+        ``build_snapshot`` does for the first page. Returns None if there is
+        no such page.
+        """
+        page = self.get_section_items(section_id, number)
+        if page is None:
+            return None
+        section, items = page
+        return self.paginate_items(section, items, number)
+
+    def paginate_items(self, section, items, number):
+        """
+        Serialise ``items`` as page ``number`` of ``section``, given the items
+        of the page followed by the first item of the next page, if any.
+        """
+        if section.page_size is not None and not self.showcase_sections.is_deferring:
+            has_next = len(items) > section.page_size
+            items = items[: section.page_size]
+        else:
+            # Unsaved changes can't be paginated, as further items are loaded
+            # from the database
+            has_next = False
+        return {
+            "items": [self.get_item_snapshot(item) for item in items],
+            "next_page": number + 1 if has_next else None,
+        }
+
+    def get_item_snapshot(self, item):
+        return item.get_snapshot()
+
+    def build_tag_listing(self, slug, number=1):
+        """
+        Get the tag with ``slug`` and the ids of page ``number`` of the live
+        entity pages under this page tagged with it, as plain JSON-compatible
+        data. Returns None if there is no such tag or the page is out of
+        range.
+        """
+        tag = Tag.objects.filter(slug=slug).first()
+        if tag is None or number < 1:
+            return None
+        start = (number - 1) * self.tag_page_size
+        page_ids = list(
+            self.get_entities()
+            .filter(tag=tag)
+            .values_list("pk", flat=True)[start : start + self.tag_page_size + 1]
+        )
+        if not page_ids and number > 1:
+            return None
+        return {
+            "tag": {"name": tag.name, "slug": tag.slug},
+            "page_ids": page_ids[: self.tag_page_size],
+            "previous_page": number - 1 if number > 1 else None,
+            "next_page": number + 1 if len(page_ids) > self.tag_page_size else None,
+        }
+
+    def get_tag_listing(self, request, slug):
+        """
+        Get page ``?page=`` of the tag listing for ``slug`` and its live entity
+        pages, from the id lists cached per tag and page.
+        """
+        number = request.GET.get("page", "1")
+        if len(slug) > 100 or not slug_re.match(slug):
+            raise Http404("Unknown tag")
+        if len(number) > 6 or not number.isascii() or not number.isdigit():
+            raise Http404("Unknown page")
+        if getattr(request, "is_preview", False):
+            listing = self.build_tag_listing(slug, int(number))
+        else:
+            listing = get_showcase_tag_listing(self, slug, int(number))
+        if listing is None:
+            raise Http404("Unknown tag")
+        entities = self.entity_model.objects.filter(
+            pk__in=listing["page_ids"]
+        ).defer_streamfields()
+        return listing, entities.order_by("path")
+
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        if getattr(request, "is_preview", False):
+            # Previews show unpublished changes, which must not be cached
+            snapshot = self.build_snapshot()
+        else:
+            snapshot = get_showcase_snapshot(self)
+        for section in snapshot["sections"]:
+            add_image_urls(section["items"])
+        context["sections"] = snapshot["sections"]
+        context["tags"] = snapshot["tags"]
+
+        slug = request.GET.get("tag")
+        if slug and self.entity_model is not None:
+            listing, context["entities"] = self.get_tag_listing(request, slug)
+            context["tag"] = listing["tag"]
+            context["tag_listing"] = listing
+        return context
+
+
+class ShowcasePage(AbstractShowcasePage):
+    """
+    Concrete base of the showcase page types, which their sections belong to,
+    so that only showcase pages have sections.
+    """
+
+    is_creatable = False
+
+    class Meta:
+        verbose_name = "Showcase Page"
+        verbose_name_plural = "Showcase Pages"
+
+
+class ProjectShowcasePage(ShowcasePage):
     """
     A page that showcases projects.
     """
 
     content_panels = AbstractShowcasePage.content_panels + [
         FieldPanel("introduction"),
-        InlinePanel(
-            "project_sections",
-            label="Sections",
-            help_text="Add and order sections to display on this page",
+        showcase_sections_panel(
+            [
+                FieldPanel("title"),
+                FieldPanel("description"),
+                FieldPanel("page"),
+                InlinePanel("links", label="Links", help_text="Links for this item"),
+            ]
         ),
     ]
 
     template = "pages/project_showcase_page.html"
+    item_template = "pages/project_showcase_item.html"
+    entity_model = ProjectPage
+    showcase_type = "project"
     parent_page_types = ["wagtailcore.Page", "pages.FlexPage"]
     subpage_types = ["pages.ProjectPage"]
 
@@ -261,21 +618,27 @@ class ProjectShowcasePage(AbstractShowcasePage):
         verbose_name_plural = "Project Showcase Pages"
 
 
-class ServiceShowcasePage(AbstractShowcasePage):
+class ServiceShowcasePage(ShowcasePage):
     """
     A page that showcases services.
     """
 
     content_panels = AbstractShowcasePage.content_panels + [
         FieldPanel("introduction"),
-        InlinePanel(
-            "service_sections",
-            label="Sections",
-            help_text="Add and order sections to display on this page",
+        showcase_sections_panel(
+            [
+                FieldPanel("title"),
+                FieldPanel("description"),
+                FieldPanel("page"),
+                InlinePanel("links", label="Links", help_text="Links for this item"),
+            ]
         ),
     ]
 
     template = "pages/service_showcase_page.html"
+    item_template = "pages/service_showcase_item.html"
+    entity_model = ServicePage
+    showcase_type = "service"
     parent_page_types = ["wagtailcore.Page", "pages.FlexPage"]
     subpage_types = ["pages.ServicePage"]
 
@@ -284,21 +647,28 @@ class ServiceShowcasePage(AbstractShowcasePage):
         verbose_name_plural = "Service Showcase Pages"
 
 
-class PortfolioShowcasePage(AbstractShowcasePage):
+class PortfolioShowcasePage(ShowcasePage):
     """
     A page that showcases portfolio items.
     """
 
     content_panels = AbstractShowcasePage.content_panels + [
         FieldPanel("introduction"),
-        InlinePanel(
-            "portfolio_sections",
-            label="Sections",
-            help_text="Add and order sections to display on this page",
+        showcase_sections_panel(
+            [
+                FieldPanel("title"),
+                FieldPanel("description"),
+                FieldPanel("page"),
+                InlinePanel("links", label="Links", help_text="Links for this item"),
+                FieldPanel("image"),
+            ]
         ),
     ]
 
     template = "pages/portfolio_showcase_page.html"
+    item_template = "pages/portfolio_showcase_item.html"
+    entity_model = PortfolioItemPage
+    showcase_type = "portfolio"
     parent_page_types = ["wagtailcore.Page", "pages.FlexPage"]
     subpage_types = ["pages.PortfolioItemPage"]
 
@@ -306,22 +676,61 @@ class PortfolioShowcasePage(AbstractShowcasePage):
         verbose_name = "Portfolio Showcase Page"
         verbose_name_plural = "Portfolio Showcase Pages"
 
-
-class ResourceShowcasePage(AbstractShowcasePage):
-    """
-    A page that showcases resources.
+    def resolve_items(self, items):
+        """
+        Resolve the linked pages to their specific type and load their images
+        (with the card rendition) in bulk, so the number of queries stays
+        constant however many items the grid shows.
+        """
+        items = [item for item in items if item.page_id is not None]
+        pages = {
+            page.pk: page
+            for page in Page.objects.filter(pk__in={item.page_id for item in items})
+            .specific()
+            .defer_streamfields()
+        }
+        image_ids = {getattr(page, "image_id", None) for page in pages.values()}
+        images = (
+            get_image_model()
+            .objects.prefetch_renditions(PORTFOLIO_CARD_RENDITION)
+            .in_bulk(image_ids - {None})
+        )
+
+        for page in pages.values():
+            if getattr(page, "image_id", None) is not None:
+                page.image = images.get(page.image_id)
+        for item in items:
+            item.page = pages.get(item.page_id, item.page)
+
+    def get_item_snapshot(self, item):
+        snapshot = super().get_item_snapshot(item)
+        # The card shows the image of the linked portfolio item page
+        image = getattr(item.page.specific, "image", None) if item.page else None
+        snapshot["image"] = (
+            get_image_snapshot(image, PORTFOLIO_CARD_RENDITION) if image else None
+        )
+        return snapshot
+
+
+class ResourceShowcasePage(ShowcasePage):
+    """
+    A page that showcases resources. Resources don't have pages to link to.
     """
 
     content_panels = AbstractShowcasePage.content_panels + [
         FieldPanel("introduction"),
-        InlinePanel(
-            "resource_sections",
-            label="Sections",
-            help_text="Add and order sections to display on this page",
+        showcase_sections_panel(
+            [
+                FieldPanel("title"),
+                FieldPanel("description"),
+                InlinePanel("links", label="Links", help_text="Links for this item"),
+            ]
         ),
     ]
 
     template = "pages/resource_showcase_page.html"
+    item_template = "pages/resource_showcase_item.html"
+    showcase_type = "resource"
     parent_page_types = ["wagtailcore.Page", "pages.FlexPage"]
     subpage_types = []
 
@@ -330,11 +739,34 @@ class ResourceShowcasePage(AbstractShowcasePage):
         verbose_name_plural = "Resource Showcase Pages"
 
 
-class AbstractShowcaseSection(ClusterableModel, Orderable):
+SHOWCASE_TYPE_CHOICES = [
+    ("project", "Project"),
+    ("service", "Service"),
+    ("portfolio", "Portfolio"),
+    ("resource", "Resource"),
+]
+
+
+class ShowcaseSection(ClusterableModel, Orderable):
     """
-    Abstract base model for showcase sections. Editors explicitly assign items to each section.
+    A section of a showcase page. Editors explicitly assign items to each section.
+
+    The sections of all showcase types share this table, with the type of
+    the page they belong to stored alongside, so that queries spanning all
+    showcases don't need one query per type.
     """
 
+    showcase_page = ParentalKey(
+        "pages.ShowcasePage",
+        on_delete=models.CASCADE,
+        related_name="showcase_sections",
+    )
+
+    # Type of the showcase page, set from the page when the section is saved
+    showcase_type = models.CharField(
+        max_length=20, choices=SHOWCASE_TYPE_CHOICES, editable=False
+    )
+
     # Section heading
     heading = models.CharField(max_length=200, help_text="Heading for this section")
 
@@ -343,94 +775,86 @@ class AbstractShowcaseSection(ClusterableModel, Orderable):
         blank=True, help_text="Optional description for this section"
     )
 
+    # Number of items rendered with the page, further items are loaded on demand
+    page_size = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(1)],
+        help_text=(
+            "Optional number of items shown when the page loads; further "
+            "items are loaded as visitors scroll. Leave empty to show all items."
+        ),
+    )
+
     panels = [
         FieldPanel("heading"),
         FieldPanel("description"),
+        FieldPanel("page_size"),
         InlinePanel("items", label="Items", help_text="Add items to this section"),
     ]
 
-    class Meta:
-        abstract = True
+    class Meta(Orderable.Meta):
+        verbose_name = "Showcase Section"
+        verbose_name_plural = "Showcase Sections"
+        indexes = [
+            models.Index(
+                fields=["showcase_page", "sort_order"],
+                name="pages_section_page_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.showcase_page.title} -> {self.heading}"
 
+    def save(self, *args, **kwargs):
+        if not self.showcase_type:
+            self.showcase_type = self.showcase_page.specific_class.showcase_type
+        super().save(*args, **kwargs)
+
     def get_items(self):
         """
-        Get items explicitly assigned to this section.
+        Get items explicitly assigned to this section. Sections loaded through
+        ``AbstractShowcasePage.get_sections`` return their prefetched items.
         """
         return self.items.all()
 
 
-class ProjectShowcaseSection(AbstractShowcaseSection):
-    """
-    A section on the project showcase page.
-    """
-
-    showcase_page = ParentalKey(
-        "pages.ProjectShowcasePage",
-        on_delete=models.CASCADE,
-        related_name="project_sections",
-    )
-
-
-class ServiceShowcaseSection(AbstractShowcaseSection):
+class ShowcaseItem(ClusterableModel, Orderable):
     """
-    A section on the service showcase page.
+    An item in a showcase section. Each item has its own title, description, and links,
+    and can optionally be attached to a page. Which fields editors get depends
+    on the type of the showcase (see ``showcase_sections_panel``).
     """
 
-    showcase_page = ParentalKey(
-        "pages.ServiceShowcasePage",
-        on_delete=models.CASCADE,
-        related_name="service_sections",
-    )
-
-
-class PortfolioShowcaseSection(AbstractShowcaseSection):
-    """
-    A section on the portfolio showcase page.
-    """
-
-    showcase_page = ParentalKey(
-        "pages.PortfolioShowcasePage",
-        on_delete=models.CASCADE,
-        related_name="portfolio_sections",
-    )
-
-
-class ResourceShowcaseSection(AbstractShowcaseSection):
-    """
-    A section on the resource showcase page.
-    """
-
-    showcase_page = ParentalKey(
-        "pages.ResourceShowcasePage",
-        on_delete=models.CASCADE,
-        related_name="resource_sections",
+    section = ParentalKey(
+        "pages.ShowcaseSection", on_delete=models.CASCADE, related_name="items"
     )
 
-
-class AbstractShowcaseItem(ClusterableModel, Orderable):
-    """
-    Abstract base model for showcase items. Each item has its own title, description, and links,
-    and can optionally be attached to a page.
-    """
-
     # Item fields
     title = models.CharField(
         max_length=200, help_text="Title for this item", default="Untitled"
     )
     description = models.TextField(blank=True, help_text="Description for this item")
 
-    # Optional page reference
+    # Optional page reference (not used by resource showcases)
     page = models.ForeignKey(
         "wagtailcore.Page",
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
+        related_name="+",
         help_text="Optional page to link to",
     )
 
+    # Image field (only used by portfolio showcases)
+    image = models.ForeignKey(
+        "wagtailimages.Image",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
     panels = [
         FieldPanel("title"),
         FieldPanel("description"),
@@ -438,84 +862,44 @@ class AbstractShowcaseItem(ClusterableModel, Orderable):
         InlinePanel("links", label="Links", help_text="Links for this item"),
     ]
 
-    class Meta:
-        abstract = True
+    class Meta(Orderable.Meta):
+        verbose_name = "Showcase Item"
+        verbose_name_plural = "Showcase Items"
+        indexes = [
+            models.Index(
+                fields=["section", "sort_order"], name="pages_item_section_order_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.section.heading} -> {self.title}"
 
     def get_links(self):
         """
-        Get links for this item.
+        Get links for this item. Items loaded through
+        ``AbstractShowcasePage.get_sections`` return their prefetched links.
         """
         return self.links.all()
 
-
-class ProjectShowcaseItem(AbstractShowcaseItem):
-    """
-    An item in a project showcase section.
-    """
-
-    section = ParentalKey(
-        "pages.ProjectShowcaseSection", on_delete=models.CASCADE, related_name="items"
-    )
-
-
-class ServiceShowcaseItem(AbstractShowcaseItem):
-    """
-    An item in a service showcase section.
-    """
-
-    section = ParentalKey(
-        "pages.ServiceShowcaseSection", on_delete=models.CASCADE, related_name="items"
-    )
-
-
-class PortfolioShowcaseItem(AbstractShowcaseItem):
-    """
-    An item in a portfolio showcase section. Includes an image field.
-    """
-
-    # Image field specific to portfolio items
-    image = models.ForeignKey(
-        "wagtailimages.Image",
-        on_delete=models.SET_NULL,
-        null=True,
-        blank=True,
-        related_name="+",
-    )
-
-    section = ParentalKey(
-        "pages.PortfolioShowcaseSection", on_delete=models.CASCADE, related_name="items"
-    )
-
-    panels = AbstractShowcaseItem.panels + [
-        FieldPanel("image"),
-    ]
-
-
-class ResourceShowcaseItem(AbstractShowcaseItem):
-    """
-    An item in a resource showcase section. Resources don't have pages to link to.
-    """
-
-    section = ParentalKey(
-        "pages.ResourceShowcaseSection", on_delete=models.CASCADE, related_name="items"
-    )
-
-    # Override the page field to make it non-editable for resources
-    page = None
-
-    panels = [
-        FieldPanel("title"),
-        FieldPanel("description"),
-        InlinePanel("links", label="Links", help_text="Links for this item"),
-    ]
+    def get_snapshot(self):
+        """
+        Serialise this item for ``AbstractShowcasePage.build_snapshot``.
+        """
+        page = self.page
+        return {
+            "title": self.title,
+            "description": self.description,
+            "page": {"title": page.title, "url": page.get_url()} if page else None,
+            "links": [
+                {"title": link.title, "url": link.url, "target": link.target}
+                for link in self.get_links()
+            ],
+        }
 
 
-class AbstractShowcaseItemLink(Orderable):
+class ShowcaseItemLink(Orderable):
     """
-    Abstract base model for showcase item links.
+    A link of a showcase item.
     """
 
     LINK_TARGET_CHOICES = [
@@ -523,6 +907,10 @@ class AbstractShowcaseItemLink(Orderable):
         ("_blank", "New Window"),
     ]
 
+    item = ParentalKey(
+        "pages.ShowcaseItem", on_delete=models.CASCADE, related_name="links"
+    )
+
     title = models.CharField(max_length=200)
     url = models.URLField()
     target = models.CharField(
@@ -535,48 +923,14 @@ class AbstractShowcaseItemLink(Orderable):
         FieldPanel("target"),
     ]
 
-    class Meta:
-        abstract = True
+    class Meta(Orderable.Meta):
+        verbose_name = "Showcase Item Link"
+        verbose_name_plural = "Showcase Item Links"
+        indexes = [
+            models.Index(
+                fields=["item", "sort_order"], name="pages_link_item_order_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.item.title} -> {self.title}"
-
-
-class ProjectShowcaseItemLink(AbstractShowcaseItemLink):
-    """
-    Links for a project showcase item.
-    """
-
-    item = ParentalKey(
-        "pages.ProjectShowcaseItem", on_delete=models.CASCADE, related_name="links"
-    )
-
-
-class ServiceShowcaseItemLink(AbstractShowcaseItemLink):
-    """
-    Links for a service showcase item.
-    """
-
-    item = ParentalKey(
-        "pages.ServiceShowcaseItem", on_delete=models.CASCADE, related_name="links"
-    )
-
-
-class PortfolioShowcaseItemLink(AbstractShowcaseItemLink):
-    """
-    Links for a portfolio showcase item.
-    """
-
-    item = ParentalKey(
-        "pages.PortfolioShowcaseItem", on_delete=models.CASCADE, related_name="links"
-    )
-
-
-class ResourceShowcaseItemLink(AbstractShowcaseItemLink):
-    """
-    Links for a resource showcase item.
-    """
-
-    item = ParentalKey(
-        "pages.ResourceShowcaseItem", on_delete=models.CASCADE, related_name="links"
-    )
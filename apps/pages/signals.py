@@ -0,0 +1,118 @@
+"""
+Signal handlers that keep showcase snapshots in sync with the database.
+
+Snapshots are invalidated once the surrounding transaction commits, so that
+a request running concurrently with an editor's change can never cache the
+old data under the new version.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from wagtail.images import get_image_model
+from wagtail.models import Page, Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .cache import get_showcase_snapshot, invalidate_showcases, page_url_cache
+from .models import (
+    AbstractShowcasePage,
+    BaseEntityPage,
+    PortfolioItemPage,
+    ShowcaseItem,
+    ShowcasePage,
+    Tag,
+)
+
+
+def invalidate_showcases_on_commit(page_ids):
+    page_ids = set(page_ids)
+    if page_ids:
+        transaction.on_commit(lambda: invalidate_showcases(page_ids))
+
+
+def get_showcases_linking_to(**lookup):
+    """Return the ids of the showcase pages with items matching ``lookup``."""
+    return set(
+        ShowcaseItem.objects.filter(**lookup).values_list(
+            "section__showcase_page_id", flat=True
+        )
+    )
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def invalidate_showcases_linking_to_page(sender, instance, **kwargs):
+    # Publishing, moving or renaming a page also changes the URLs of its
+    # descendants, so showcases linking to any page in the subtree are stale
+    invalidate_showcases_on_commit(
+        get_showcases_linking_to(page__path__startswith=instance.path)
+    )
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def invalidate_showcases_listing_page(sender, instance, **kwargs):
+    # Showcases list their live entity pages by tag
+    if not isinstance(instance, BaseEntityPage):
+        return
+    if "parent_page_before" in kwargs:
+        parents = [kwargs["parent_page_before"], kwargs["parent_page_after"]]
+    else:
+        parents = [instance.get_parent()]
+    invalidate_showcases_on_commit(parent.pk for parent in parents if parent)
+
+
+# Connected after the handler above, so that the snapshot is rebuilt after the
+# version bump that publishing a showcase (whose items link to its own child
+# pages) triggers there
+@receiver(page_published)
+def materialise_showcase_snapshot(sender, instance, **kwargs):
+    if not isinstance(instance, AbstractShowcasePage):
+        return
+
+    def rebuild():
+        invalidate_showcases([instance.pk])
+        # Build from a fresh instance, as the published one still carries the
+        # in-memory sections of the revision
+        get_showcase_snapshot(type(instance).objects.get(pk=instance.pk))
+
+    transaction.on_commit(rebuild)
+
+
+@receiver(pre_delete)
+def invalidate_showcases_linking_to_deleted_page(sender, instance, **kwargs):
+    if isinstance(instance, Page):
+        invalidate_showcases_on_commit(get_showcases_linking_to(page_id=instance.pk))
+    if isinstance(instance, BaseEntityPage) and instance.live:
+        parent = instance.get_parent()
+        if parent:
+            invalidate_showcases_on_commit([parent.pk])
+
+
+@receiver(post_save, sender=get_image_model())
+@receiver(post_delete, sender=get_image_model())
+def invalidate_showcases_showing_image(sender, instance, **kwargs):
+    invalidate_showcases_on_commit(
+        get_showcases_linking_to(
+            page__in=PortfolioItemPage.objects.filter(image=instance.pk).values("pk")
+        )
+    )
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_all_showcases(sender, instance, **kwargs):
+    # Snapshots hold page URLs resolved against the site root paths, and the
+    # names and slugs of the tags to filter by
+    invalidate_showcases_on_commit(ShowcasePage.objects.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def invalidate_page_urls(sender, instance, **kwargs):
+    # Page URLs are resolved against the site root paths
+    transaction.on_commit(page_url_cache.invalidate)
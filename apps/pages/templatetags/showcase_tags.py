@@ -0,0 +1,22 @@
+from django import template
+from django.urls import reverse
+
+register = template.Library()
+
+
+def showcase_items_frame_id(section_id, number):
+    return f"showcase-section-{section_id}-items-{number}"
+
+
+@register.inclusion_tag("pages/showcase_items_frame.html")
+def showcase_items_frame(page, section_id, number):
+    """
+    Renders a Turbo Frame that loads page ``number`` of the items of a
+    paginated section when it scrolls into view.
+    """
+    return {
+        "frame_id": showcase_items_frame_id(section_id, number),
+        "src": reverse(
+            "pages:showcase_section_items", args=[page.pk, section_id, number]
+        ),
+    }
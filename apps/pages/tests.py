@@ -1 +1,178 @@
-# Create your tests here.
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from wagtail.models import Page, Site
+
+from .cache import get_showcase_version
+from .importing import InvalidRecord, ShowcaseImporter
+from .models import (
+    ProjectPage,
+    ProjectShowcasePage,
+    ServiceShowcasePage,
+    ShowcaseItem,
+    ShowcaseSection,
+    Tag,
+)
+
+# Keeps the tests off the database cache
+TEST_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class ShowcaseImporterTests(TestCase):
+    def setUp(self):
+        root = Page.get_first_root_node()
+        self.showcase = root.add_child(
+            instance=ProjectShowcasePage(title="Projects", slug="projects")
+        )
+        self.showcase.save_revision().publish()
+        self.showcase.refresh_from_db()
+
+    def get_live_item_titles(self):
+        showcase = ProjectShowcasePage.objects.get(pk=self.showcase.pk)
+        live = showcase.live_revision.as_object()
+        return [
+            item.title
+            for section in live.showcase_sections.all()
+            for item in section.items.all()
+        ]
+
+    def test_import(self):
+        records = [{"title": "One", "tag": "Web"}, {"title": "Two", "live": "no"}]
+        imported = ShowcaseImporter(self.showcase).run(records)
+
+        self.assertEqual(imported, 2)
+        one, two = ProjectPage.objects.child_of(self.showcase).order_by("path")
+        self.assertTrue(one.live)
+        self.assertEqual(one.live_revision, one.latest_revision)
+        self.assertEqual(one.tag.name, "Web")
+        self.assertFalse(two.live)
+        self.assertIsNone(two.live_revision)
+        self.assertIsNotNone(two.latest_revision)
+        self.assertEqual(self.get_live_item_titles(), ["One", "Two"])
+
+    def test_failed_batch_keeps_committed_batches_in_revision(self):
+        records = [{"title": f"Item {index}"} for index in range(5)]
+        records.insert(3, {"description": "No title"})
+
+        with self.assertRaises(InvalidRecord):
+            ShowcaseImporter(self.showcase).run(records, batch_size=2)
+
+        # The first batch was committed, the second one rolled back
+        titles = ["Item 0", "Item 1"]
+        self.assertEqual(
+            list(ShowcaseItem.objects.values_list("title", flat=True)), titles
+        )
+        self.assertEqual(self.get_live_item_titles(), titles)
+
+        # Publishing the live revision again keeps the imported items
+        showcase = ProjectShowcasePage.objects.get(pk=self.showcase.pk)
+        showcase.live_revision.publish()
+        self.assertEqual(
+            list(ShowcaseItem.objects.values_list("title", flat=True)), titles
+        )
+
+    def test_unknown_url_type_preference(self):
+        records = [{"title": "One", "url_type_preference": "slug"}]
+
+        with self.assertRaisesMessage(InvalidRecord, "url_type_preference"):
+            ShowcaseImporter(self.showcase).run(records)
+
+        self.assertFalse(ProjectPage.objects.exists())
+        self.assertFalse(ShowcaseItem.objects.exists())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ShowcaseInvalidationTests(TestCase):
+    def test_tag_changes_invalidate_every_showcase(self):
+        root = Page.get_first_root_node()
+        showcases = [
+            root.add_child(instance=ProjectShowcasePage(title="Projects", slug="p")),
+            root.add_child(instance=ServiceShowcasePage(title="Services", slug="s")),
+        ]
+        versions = [get_showcase_version(showcase.pk) for showcase in showcases]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag.objects.create(name="Web", slug="web")
+
+        for showcase, version in zip(showcases, versions):
+            self.assertNotEqual(get_showcase_version(showcase.pk), version)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ShowcasePaginationTests(TestCase):
+    def setUp(self):
+        home = Site.objects.get(is_default_site=True).root_page
+        self.showcase = home.add_child(
+            instance=ProjectShowcasePage(title="Projects", slug="projects")
+        )
+        self.tag = Tag.objects.create(name="Web", slug="web")
+        for index in range(5):
+            page = self.showcase.add_child(
+                instance=ProjectPage(
+                    title=f"Project {index}", slug=f"project-{index}", tag=self.tag
+                )
+            )
+            page.save_revision().publish()
+
+        section = ShowcaseSection(heading="Featured", page_size=2)
+        section.items = [ShowcaseItem(title=f"Item {index}") for index in range(5)]
+        self.showcase.showcase_sections = [section]
+        self.showcase.save_revision().publish()
+        self.section = ShowcaseSection.objects.get(showcase_page=self.showcase)
+
+    def test_tag_listing_pages(self):
+        with mock.patch.object(ProjectShowcasePage, "tag_page_size", 2):
+            response = self.client.get("/projects/", {"tag": "web"})
+            self.assertEqual(
+                [page.title for page in response.context["entities"]],
+                ["Project 0", "Project 1"],
+            )
+            self.assertEqual(response.context["tag_listing"]["next_page"], 2)
+            self.assertContains(response, "?tag=web&amp;page=2")
+
+            response = self.client.get("/projects/", {"tag": "web", "page": 3})
+            self.assertEqual(
+                [page.title for page in response.context["entities"]], ["Project 4"]
+            )
+            self.assertEqual(response.context["tag_listing"]["previous_page"], 2)
+            self.assertIsNone(response.context["tag_listing"]["next_page"])
+
+            for params in [
+                {"tag": "web", "page": 4},
+                {"tag": "web", "page": 0},
+                {"tag": "web", "page": "x"},
+                {"tag": "other"},
+            ]:
+                response = self.client.get("/projects/", params)
+                self.assertEqual(response.status_code, 404, params)
+
+    def test_section_items_pages(self):
+        response = self.client.get("/projects/")
+        (section,) = response.context["sections"]
+        self.assertEqual(
+            [item["title"] for item in section["items"]], ["Item 0", "Item 1"]
+        )
+        self.assertEqual(section["next_page"], 2)
+
+        def get_items(number):
+            return self.client.get(
+                reverse(
+                    "pages:showcase_section_items",
+                    args=[self.showcase.pk, self.section.pk, number],
+                )
+            )
+
+        response = get_items(2)
+        self.assertEqual(
+            [item["title"] for item in response.context["items"]], ["Item 2", "Item 3"]
+        )
+        self.assertEqual(response.context["next_page"], 3)
+
+        response = get_items(3)
+        self.assertEqual(
+            [item["title"] for item in response.context["items"]], ["Item 4"]
+        )
+        self.assertIsNone(response.context["next_page"])
+
+        self.assertEqual(get_items(4).status_code, 404)
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from . import views
+
+app_name = "pages"
+
+urlpatterns = [
+    path(
+        "<int:page_id>/sections/<int:section_id>/items/<int:number>/",
+        views.showcase_section_items,
+        name="showcase_section_items",
+    ),
+]
@@ -1 +1,44 @@
-# Create your views here.
+from django.http import Http404
+from django.shortcuts import get_object_or_404, render
+from django.views.decorators.http import require_GET
+from wagtail.models import Page
+
+from .cache import add_image_urls, get_showcase_items_snapshot
+from .models import AbstractShowcasePage
+from .templatetags.showcase_tags import showcase_items_frame_id
+
+
+@require_GET
+def showcase_section_items(request, page_id, section_id, number):
+    """
+    Render page ``number`` of the items of a paginated showcase section
+    inside a Turbo Frame. Showcase pages only render the first page of such
+    sections and lazily load the following pages from here as visitors
+    scroll, each page chaining the frame of the next one.
+    """
+    page = get_object_or_404(Page.objects.live(), pk=page_id).specific
+    if not isinstance(page, AbstractShowcasePage):
+        raise Http404("Not a showcase page")
+
+    # The items are subject to the same restrictions as the page itself
+    for restriction in page.get_view_restrictions():
+        if not restriction.accept_request(request):
+            raise Http404("Showcase page not found")
+
+    snapshot = get_showcase_items_snapshot(page, section_id, number)
+    if snapshot is None:
+        raise Http404("Showcase items not found")
+
+    return render(
+        request,
+        "pages/showcase_section_items.html",
+        {
+            "frame_id": showcase_items_frame_id(section_id, number),
+            "page": page,
+            "section_id": section_id,
+            "number": number,
+            "items": add_image_urls(snapshot["items"]),
+            "next_page": snapshot["next_page"],
+            "item_template": page.item_template,
+        },
+    )
@@ -1,3 +1,5 @@
+import copy
+
 from django.db import models
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
@@ -5,6 +7,10 @@ from wagtail.contrib.settings.models import BaseSiteSetting, register_setting
 from wagtail.images.models import Image
 from wagtail.admin.panels import FieldPanel, MultiFieldPanel, InlinePanel
 from wagtail.models import Orderable
+from apps.core.cache import LocalCache
+
+# Site settings are read on every page render; keep them in process memory
+settings_cache = LocalCache("site_settings", max_size=32)
 
 
 class SocialMediaLink(Orderable):
@@ -95,3 +101,17 @@ class SiteSettings(BaseSiteSetting, ClusterableModel):
 
     class Meta:
         verbose_name = "Site Settings"
+
+    @classmethod
+    def for_site(cls, site):
+        """
+        Get the settings for the site from the process-local cache, falling
+        back to the database. A copy is returned, since ``for_request``
+        attaches the current request to the instance.
+        """
+        if site is None:
+            return super().for_site(site)
+        instance = settings_cache.get_or_set(
+            site.pk, lambda: super(SiteSettings, cls).for_site(site)
+        )
+        return copy.copy(instance)
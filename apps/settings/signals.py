@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.models import Site
+
+from .models import SiteSettings, SocialMediaLink, settings_cache
+
+
+@receiver(post_save, sender=SiteSettings)
+@receiver(post_delete, sender=SiteSettings)
+@receiver(post_save, sender=SocialMediaLink)
+@receiver(post_delete, sender=SocialMediaLink)
+@receiver(post_delete, sender=Site)
+def invalidate_site_settings(sender, instance, **kwargs):
+    transaction.on_commit(settings_cache.invalidate)
@@ -300,6 +300,16 @@ CACHES = {
     }
 }
 
+# Task settings (django-tasks, also used by Wagtail)
+# There is no worker process, so tasks run synchronously when they are
+# enqueued, i.e. in the request that triggered them. Tasks enqueued by this
+# project bound the work they do inline, see apps.blocks.tasks
+TASKS = {
+    "default": {
+        "BACKEND": "django_tasks.backends.immediate.ImmediateBackend",
+    }
+}
+
 # Webpack loader settings
 WEBPACK_LOADER = {
     "MANIFEST_FILE": os.path.join(BASE_DIR, "apps/frontend/build/manifest.json"),
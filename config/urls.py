@@ -30,6 +30,8 @@ urlpatterns = [
     path("documents/", include(wagtaildocs_urls)),
     path("search/", include("apps.search.urls")),
     path("forms/", include("apps.forms.urls")),
+    path("navigation/", include("apps.navigation.urls")),
+    path("showcases/", include("apps.pages.urls")),
     path("", include(wagtail_urls)),
 ]
 
@@ -68,6 +68,8 @@ export default class extends Controller {
 
     if (details.open) {
       // Dropdown is currently open, so we're closing it
+      // Start from the rendered height, as the open state has no max-height
+      gsap.set(content, { maxHeight: content.scrollHeight });
       gsap.to(content, {
         // Animate the max-height to 0 to create the closing effect
         maxHeight: 0,
@@ -112,6 +114,12 @@ export default class extends Controller {
         maxHeight: content.scrollHeight + 100, // Add buffer
         duration: this.constructor.animationDuration,
         ease: this.constructor.easeOut,
+
+        // Lift the limit once open, so children lazily loaded into a
+        // turbo-frame after the animation are not clipped
+        onComplete: () => {
+          content.style.maxHeight = "none";
+        },
       });
 
       // Rotate icon - find the SVG icon in the summary element
@@ -36,6 +36,13 @@ make migrate
 echo "Creating cache table..."
 make createcachetable || echo "Cache table creation completed or skipped"
 
+# Pre-build navigation menus so the first requests do not pay for cold caches
+# (set WARM_NAVIGATION=0 to skip)
+if [ "${WARM_NAVIGATION:-1}" = "1" ]; then
+    echo "Warming navigation cache..."
+    make warm-navigation || echo "Navigation cache warming failed, continuing"
+fi
+
 # Ensure database files have proper permissions after migrations
 chmod 644 /app/db/*.db 2>/dev/null || echo "No database files to set permissions for yet"
 